@@ -0,0 +1,131 @@
+"""
+Sound effects
+Every effect is decoded (or synthesised) once at startup into a
+pygame.mixer.Sound and played on a fixed pool of reserved channels. Busy
+pools steal the lowest-priority voice, repeated triggers are rate limited,
+and playing only queues audio for the mixer thread, so the frame loop never
+waits. Without an audio device a silent driver takes its place.
+"""
+
+import os
+import time
+
+import numpy as np
+import pygame
+
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512  # Samples; small for low trigger latency
+
+# name: priority (higher wins a channel), minimum seconds between triggers,
+# volume and the chiptune recipe used when no sound file overrides it
+SOUND_EFFECTS = {
+    "jump": {"priority": 2, "min_interval": 0.15, "volume": 0.5,
+             "wave": "square", "freqs": (330, 660), "duration": 0.12},
+    "shoot": {"priority": 1, "min_interval": 0.08, "volume": 0.35,
+              "wave": "square", "freqs": (1200, 300), "duration": 0.08},
+    "hit": {"priority": 2, "min_interval": 0.05, "volume": 0.5,
+            "wave": "noise", "freqs": (0, 0), "duration": 0.12},
+    "hurt": {"priority": 3, "min_interval": 0.25, "volume": 0.6,
+             "wave": "square", "freqs": (220, 110), "duration": 0.25},
+    "coin": {"priority": 2, "min_interval": 0.05, "volume": 0.45,
+             "wave": "square", "freqs": (988, 1319), "duration": 0.15, "steps": 2},
+    "game_over": {"priority": 4, "min_interval": 1.0, "volume": 0.7,
+                  "wave": "square", "freqs": (523, 131), "duration": 0.9, "steps": 4},
+}
+
+
+def synthesize(spec, frequency=MIXER_FREQUENCY):
+    """Mono float samples in [-1, 1] for a SOUND_EFFECTS recipe"""
+    n = int(spec["duration"] * frequency)
+    t = np.arange(n) / frequency
+    start, end = spec["freqs"]
+    steps = spec.get("steps")
+    if steps:
+        # Stepped arpeggio instead of a continuous sweep
+        freq = start + (end - start) * np.floor(t / spec["duration"] * steps) / max(1, steps - 1)
+    else:
+        freq = start + (end - start) * t / spec["duration"]
+    if spec["wave"] == "noise":
+        wave = np.random.default_rng(0).uniform(-1, 1, n)
+    else:
+        phase = 2 * np.pi * np.cumsum(freq) / frequency
+        wave = np.sign(np.sin(phase))
+    envelope = np.minimum(1.0, np.linspace(8, 0, n))  # Hold, then fade out
+    return wave * envelope
+
+
+class SilentAudio:
+    """No-op driver used when there is no audio device or sound is muted"""
+    def play(self, name):
+        pass
+
+    def close(self):
+        pass
+
+
+class AudioEngine:
+    """Reserved channel pool with per-effect priority and voice stealing"""
+
+    def __init__(self, sound_dir="sounds", channels=8, effects=SOUND_EFFECTS):
+        self.effects = effects
+        self.sounds = {name: self._load(sound_dir, name, spec) for name, spec in effects.items()}
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), channels))
+        pygame.mixer.set_reserved(channels)  # Ad-hoc Sound.play() calls never take these
+        self.channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self.voices = [(0, 0.0)] * channels  # (priority, start time) per channel
+        self.last_played = {name: -1.0 for name in effects}
+        self.played = self.limited = self.stolen = self.dropped = 0
+
+    def _load(self, sound_dir, name, spec):
+        for ext in (".ogg", ".wav"):
+            path = os.path.join(sound_dir, name + ext)
+            if os.path.exists(path):
+                sound = pygame.mixer.Sound(path)
+                break
+        else:
+            frequency, _, mixer_channels = pygame.mixer.get_init()
+            samples = (synthesize(spec, frequency) * 32767).astype(np.int16)
+            if mixer_channels > 1:
+                samples = np.repeat(samples[:, None], mixer_channels, axis=1)
+            sound = pygame.sndarray.make_sound(samples)
+        sound.set_volume(spec["volume"])
+        return sound
+
+    def play(self, name):
+        now = time.perf_counter()
+        spec = self.effects[name]
+        if now - self.last_played[name] < spec["min_interval"]:
+            self.limited += 1
+            return
+        self.last_played[name] = now
+
+        priority = spec["priority"]
+        slot = next((i for i, channel in enumerate(self.channels) if not channel.get_busy()), None)
+        if slot is None:
+            # Steal the lowest-priority voice, oldest first; never a more important one
+            slot = min(range(len(self.channels)), key=lambda i: self.voices[i])
+            if self.voices[slot][0] > priority:
+                self.dropped += 1
+                return
+            self.stolen += 1
+        self.channels[slot].play(self.sounds[name])
+        self.voices[slot] = (priority, now)
+        self.played += 1
+
+    def close(self):
+        print(f"✓ Audio: {self.played} played, {self.limited} rate limited, "
+              f"{self.stolen} stolen, {self.dropped} dropped")
+        pygame.mixer.quit()
+
+
+def open_audio(sound_dir="sounds", channels=8, mute=False):
+    """AudioEngine on the mixer, or SilentAudio if muted or no device is available"""
+    if mute:
+        return SilentAudio()
+    try:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(MIXER_FREQUENCY, -16, 2, MIXER_BUFFER)
+        return AudioEngine(sound_dir, channels)
+    except pygame.error as e:
+        print(f"No audio device ({e}); sound disabled")
+        return SilentAudio()
@@ -0,0 +1,79 @@
+"""
+Autopilot input driver
+Plays the game through the same jump/duck/shoot/speed controls that the
+gesture input produces, so bots exercise exactly the player's interface
+"""
+
+import random
+
+from gestures import NONE
+
+
+class BotInput:
+    """Rule-based bot with a reaction delay and occasional mistakes.
+
+    Decisions are re-made every `reaction_frames` frames and held in between,
+    like a player holding a gesture. `error_rate` is the chance to miss a
+    needed jump at each decision.
+    """
+    has_frame = False  # No camera preview to show
+    read_time = 0.0  # Never waits on a camera
+    left_gesture = right_gesture = NONE
+
+    def __init__(self, rng=None, reaction_frames=6, jump_timing=0.35, error_rate=0.02, cruise_speed=3):
+        self.rng = rng or random.Random()
+        self.reaction_frames = reaction_frames
+        self.jump_timing = jump_timing
+        self.error_rate = error_rate
+        self.cruise_speed = cruise_speed
+        self.frame = 0
+        self.controls = {"jump": False, "duck": False, "shoot": False, "speed": cruise_speed}
+
+    def poll(self, game):
+        self.frame += 1
+        if self.frame % self.reaction_frames:
+            return self.controls
+
+        player = game.player
+        front = player.x + player.width
+        speed = self.cruise_speed
+        # Frames spent in the air and the distance the world scrolls meanwhile
+        air_time = 2 * abs(player.jump_strength) / player.gravity
+        reach = air_time * speed * self.jump_timing
+
+        jump = shoot = air_blocked = False
+        for obstacle in game.obstacles:
+            gap = obstacle.x - front
+            if obstacle.type == "ground" and -obstacle.width < gap < reach:
+                jump = True
+            elif obstacle.type == "air" and -obstacle.width < gap < air_time * speed:
+                air_blocked = True
+
+        for enemy in game.enemies:
+            gap = enemy.x - front
+            if gap > 0:
+                shoot = True
+            if -enemy.width < gap < reach:
+                jump = True
+
+        for projectile in game.projectiles:
+            if projectile.shooter == "enemy":
+                gap = projectile.x - front
+                if -player.width < gap < projectile.speed * air_time * self.jump_timing:
+                    jump = True
+
+        if jump and self.rng.random() < self.error_rate:
+            jump = False
+
+        self.controls = {
+            "jump": jump and not air_blocked,
+            # Ducking mid-jump forces a fall, used to drop under hanging obstacles
+            "duck": air_blocked and player.is_jumping,
+            "shoot": shoot,
+            # The gun gesture occupies the right hand, so speed falls back to normal
+            "speed": 3 if shoot else speed,
+        }
+        return self.controls
+
+    def close(self):
+        pass
@@ -0,0 +1,134 @@
+"""
+Monte Carlo Balancing Harness
+Runs thousands of autopilot sessions per parameter set across CPU cores
+with the display disabled, and aggregates survival time, score and death
+causes for each set
+
+Usage:
+  python balance.py --sessions 2000 --set enemy_shoot_cooldown=1.5,2.0 --set gravity=0.5,0.6
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+import numpy as np
+
+SIM_DT = 1 / 60  # Fixed step: sessions run as fast as the CPU allows
+
+_game = None
+_bot_class = None
+_defaults = None
+
+
+def _init_worker():
+    """Import the game headless once per worker process"""
+    global _game, _bot_class, _defaults
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["SDL_NO_SIGNAL_HANDLERS"] = "1"  # Otherwise SDL swallows the pool's SIGTERM
+    sys.argv = ["gesture_game.py", "--input", "bot", "--mute"]  # gesture_game parses its options on import
+    import gesture_game
+    from autopilot import BotInput
+    _game = gesture_game
+    _bot_class = BotInput
+    _defaults = dict(gesture_game.GAME_PARAMS)
+
+
+def run_session(task):
+    """Play one bot session to game over (or the time limit)"""
+    set_index, params, bot_params, seed, max_time = task
+    _game.GAME_PARAMS.update(_defaults)
+    _game.GAME_PARAMS.update(params)
+    random.seed(seed)
+
+    game = _game.Game()
+    bot = _bot_class(rng=random.Random(seed), **bot_params)
+    while not game.game_over and game.time_alive < max_time:
+        game.apply_controls(bot.poll(game))
+        game.update(SIM_DT)
+    return set_index, game.time_alive, game.score, game.death_cause or "timeout"
+
+
+def parse_sets(specs):
+    """--set name=v1,v2 options into a list of parameter dicts (full grid)"""
+    grid = {}
+    for spec in specs:
+        name, _, values = spec.partition("=")
+        grid[name] = [float(v) for v in values.split(",")]
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())] or [{}]
+
+
+def summarize(params, times, scores, causes):
+    times = np.array(times)
+    scores = np.array(scores)
+    row = dict(params)
+    row.update(
+        sessions=len(times),
+        survival_mean=times.mean(),
+        survival_median=float(np.median(times)),
+        survival_p10=float(np.percentile(times, 10)),
+        score_mean=scores.mean(),
+        score_max=int(scores.max()),
+    )
+    for cause, count in sorted(causes.items()):
+        row[f"death_{cause}"] = count / len(times)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balancing with autopilot bots")
+    parser.add_argument("--set", action="append", default=[], metavar="PARAM=V1,V2",
+                        help="Game parameter values to sweep (see GAME_PARAMS in gesture_game.py)")
+    parser.add_argument("--sessions", type=int, default=1000, help="Bot sessions per parameter set")
+    parser.add_argument("--max-time", type=float, default=300.0, help="Game seconds before a session times out")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bot-error-rate", type=float, default=0.02)
+    parser.add_argument("--bot-reaction", type=int, default=6, help="Bot reaction time in frames")
+    parser.add_argument("--out", default="balance_results.csv")
+    args = parser.parse_args()
+
+    param_sets = parse_sets(args.set)
+    bot_params = {"error_rate": args.bot_error_rate, "reaction_frames": args.bot_reaction}
+    tasks = [(i, params, bot_params, args.seed * 1_000_003 + n, args.max_time)
+             for i, params in enumerate(param_sets) for n in range(args.sessions)]
+    print(f"Running {len(tasks)} sessions ({len(param_sets)} parameter sets) on {args.workers} workers...")
+
+    times = [[] for _ in param_sets]
+    scores = [[] for _ in param_sets]
+    causes = [Counter() for _ in param_sets]
+    start = time.perf_counter()
+    with Pool(args.workers, initializer=_init_worker) as pool:
+        chunksize = max(1, len(tasks) // (args.workers * 8))
+        for i, alive, score, cause in pool.imap_unordered(run_session, tasks, chunksize=chunksize):
+            times[i].append(alive)
+            scores[i].append(score)
+            causes[i][cause] += 1
+    elapsed = time.perf_counter() - start
+
+    rows = [summarize(p, times[i], scores[i], causes[i]) for i, p in enumerate(param_sets)]
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    with open(args.out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields, restval=0)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    print(f"\n✓ {len(tasks)} sessions in {elapsed:.1f}s ({len(tasks) / elapsed:.1f} sessions/s)\n")
+    for row in rows:
+        label = ", ".join(f"{k}={row[k]}" for k in param_sets[0]) or "defaults"
+        deaths = ", ".join(f"{k[6:]} {v:.0%}" for k, v in row.items() if k.startswith("death_"))
+        print(f"{label}: survival {row['survival_mean']:.1f}s (median {row['survival_median']:.1f}s), "
+              f"score {row['score_mean']:.0f}; deaths: {deaths}")
+    print(f"\n✓ Results saved to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
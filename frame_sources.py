@@ -0,0 +1,292 @@
+"""
+Frame sources for the capture stage
+Webcam, video file and image directory inputs behind the same
+read()/release() interface as cv2.VideoCapture. Webcams negotiate the
+smallest capture mode that meets the inference targets and keep as few
+frames queued as the driver allows. File sources decode ahead on a
+background thread into a bounded ring of reused frame buffers.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+# -------------------- Camera Modes --------------------
+PROBE_SIZES = [(160, 120), (320, 180), (320, 240), (424, 240), (640, 360), (640, 480),
+               (800, 600), (960, 540), (1280, 720), (1920, 1080)]
+PROBE_FPS = [15, 30, 60]
+# Preference order for equally small modes: raw YUYV skips a JPEG decode per
+# frame, MJPG is what most cameras need for high frame rates at large sizes
+PROBE_FOURCCS = ["YUYV", "MJPG"]
+MODE_CACHE = ".camera_modes.json"
+
+
+def fourcc_name(value):
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\0 ")
+
+
+def apply_mode(cap, width, height, fps, fourcc):
+    # FOURCC first: some drivers reset the size when the pixel format changes
+    cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    cap.set(cv2.CAP_PROP_FPS, fps)
+
+
+def current_mode(cap):
+    return [int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)), int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            cap.get(cv2.CAP_PROP_FPS), fourcc_name(cap.get(cv2.CAP_PROP_FOURCC))]
+
+
+def probe_modes(cap):
+    """Every (width, height, fps, fourcc) the driver accepts from the probe grid.
+
+    The device is put back in the mode it was in, so a failed selection
+    leaves the driver defaults rather than the last mode tried.
+    """
+    original = [(prop, cap.get(prop)) for prop in (cv2.CAP_PROP_FOURCC, cv2.CAP_PROP_FRAME_WIDTH,
+                                                     cv2.CAP_PROP_FRAME_HEIGHT, cv2.CAP_PROP_FPS)]
+    modes = []
+    for fourcc in PROBE_FOURCCS:
+        for width, height in PROBE_SIZES:
+            for fps in PROBE_FPS:
+                apply_mode(cap, width, height, fps, fourcc)
+                got_w, got_h, got_fps, got_fourcc = current_mode(cap)
+                if (got_w, got_h) != (width, height) or got_fourcc != fourcc:
+                    continue
+                # Backends that cannot report the rate return 0: trust the request
+                mode = [width, height, round(got_fps) if got_fps > 0 else fps, fourcc]
+                if mode not in modes:
+                    modes.append(mode)
+    for prop, value in original:
+        cap.set(prop, value)
+    return modes
+
+
+def cached_modes(cap, device, cache_path=MODE_CACHE, reprobe=False):
+    """Probe a device once; later runs read its modes from the JSON cache"""
+    key = f"{cap.getBackendName()}:{device}"
+    cache = {}
+    if os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+    if reprobe or key not in cache:
+        print(f"Probing capture modes for camera {device}...")
+        cache[key] = probe_modes(cap)
+        with open(cache_path, "w") as f:
+            json.dump(cache, f)
+    return cache[key]
+
+
+def select_mode(modes, min_width, min_height, min_fps):
+    """Smallest mode meeting the targets; otherwise the fastest at the target size"""
+    large_enough = [m for m in modes if m[0] >= min_width and m[1] >= min_height]
+    suitable = [m for m in large_enough if m[2] >= min_fps]
+    if suitable:
+        # min() returns the first of equal modes, so PROBE_FOURCCS order breaks ties
+        return min(suitable, key=lambda m: (m[0] * m[1], m[2]))
+    if large_enough:
+        return max(large_enough, key=lambda m: (m[2], -m[0] * m[1]))
+    return None
+
+
+class WebcamSource:
+    """Live camera; frames arrive at the device's own pace.
+
+    With a `target` of (width, height, fps) the capture mode is negotiated
+    from the device's probed modes; None keeps the driver defaults. If the
+    driver ignores CAP_PROP_BUFFERSIZE, read() drains queued frames itself so
+    the controls never act on a stale image.
+    """
+
+    def __init__(self, device=0, target=(320, 240, 30), reprobe=False):
+        self.cap = cv2.VideoCapture(device)
+        self.dropped = 0
+        self.drain = False
+        if not self.cap.isOpened():
+            print(f"Could not open camera {device}")
+            return
+        if target:
+            mode = select_mode(cached_modes(self.cap, device, reprobe=reprobe), *target)
+            if mode:
+                apply_mode(self.cap, *mode)
+        self.drain = not (self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                          and self.cap.get(cv2.CAP_PROP_BUFFERSIZE) == 1)
+        width, height, fps, fourcc = current_mode(self.cap)
+        self.fps = fps or 30.0
+        print(f"✓ Camera {device}: {width}x{height} @ {fps:.0f} fps {fourcc or '?'}, "
+              f"{'draining queued frames' if self.drain else '1 frame buffer'}")
+
+    def read(self):
+        if not self.drain:
+            return self.cap.read()
+        # A buffered frame grabs instantly; keep grabbing until one had to be
+        # waited for, which means it is fresh from the sensor
+        for skipped in range(4):
+            start = time.perf_counter()
+            if not self.cap.grab():
+                return False, None
+            if time.perf_counter() - start > 0.5 / self.fps:
+                break
+        self.dropped += skipped
+        return self.cap.retrieve()
+
+    def release(self):
+        self.cap.release()
+
+
+class PrefetchSource:
+    """Base for file sources: a decoder thread fills a ring of frame buffers.
+
+    The array returned by read() stays valid until the next read(), when its
+    buffer goes back to the decoder. With `realtime` pacing frames are handed
+    out at the source frame rate and late frames are dropped, like a camera;
+    otherwise they are returned as fast as they can be decoded.
+    """
+
+    def __init__(self, fps, buffer_frames=8, realtime=True, loop=False):
+        self.fps = fps or 30.0
+        self.realtime = realtime
+        self.loop = loop
+        self.dropped = 0
+        self._buffers = [None] * buffer_frames
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        for slot in range(buffer_frames):
+            self._free.put(slot)
+        self._held = None
+        self._start_time = None
+        self._frame_index = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._decode_loop, daemon=True)
+        self._thread.start()
+
+    def _decode_into(self, buffer):
+        """Decode the next frame, reusing `buffer` if possible; None at end of stream"""
+        raise NotImplementedError
+
+    def _rewind(self):
+        raise NotImplementedError
+
+    def _decode_loop(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    slot = self._free.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                frame = self._decode_into(self._buffers[slot])
+                if frame is None and self.loop and self._rewind():
+                    frame = self._decode_into(self._buffers[slot])
+                if frame is None:
+                    self._free.put(slot)
+                    return
+                self._buffers[slot] = frame
+                self._ready.put(slot)
+        finally:
+            # End of stream marker, also when decoding raised, so read() never
+            # waits on a thread that is gone
+            self._ready.put(None)
+
+    def read(self):
+        if self._held is not None:
+            self._free.put(self._held)
+            self._held = None
+
+        while True:
+            slot = self._ready.get()
+            if slot is None:
+                self._ready.put(None)  # Keep reporting end of stream
+                return False, None
+            if self.realtime:
+                if self._start_time is None:
+                    self._start_time = time.perf_counter()
+                due = self._start_time + self._frame_index / self.fps
+                self._frame_index += 1
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                elif -delay > 1 / self.fps and not self._ready.empty():
+                    # More than a frame behind: skip ahead like a live camera would
+                    self._free.put(slot)
+                    self.dropped += 1
+                    continue
+            self._held = slot
+            return True, self._buffers[slot]
+
+    def release(self):
+        self._stop.set()
+        self._thread.join(timeout=1.0)
+
+
+class VideoFileSource(PrefetchSource):
+    def __init__(self, path, **kwargs):
+        self.cap = cv2.VideoCapture(path)
+        if not self.cap.isOpened():
+            raise IOError(f"Could not open video: {path}")
+        super().__init__(self.cap.get(cv2.CAP_PROP_FPS), **kwargs)
+
+    def _decode_into(self, buffer):
+        # VideoCapture decodes straight into `buffer` when its shape matches
+        ret, frame = self.cap.read(buffer)
+        return frame if ret else None
+
+    def _rewind(self):
+        return self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class ImageDirSource(PrefetchSource):
+    def __init__(self, path, fps=30.0, **kwargs):
+        self.paths = sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.lower().endswith(IMAGE_EXTENSIONS))
+        if not self.paths:
+            raise IOError(f"No images found in: {path}")
+        self._next = 0
+        super().__init__(fps, **kwargs)
+
+    def _decode_into(self, buffer):
+        while self._next < len(self.paths):
+            image = cv2.imread(self.paths[self._next])
+            self._next += 1
+            if image is None:
+                continue
+            if buffer is not None and buffer.shape == image.shape:
+                np.copyto(buffer, image)
+                return buffer
+            return image
+        return None
+
+    def _rewind(self):
+        self._next = 0
+        return True
+
+
+def parse_capture(spec):
+    """'WIDTHxHEIGHT@FPS' into a capture target; 'driver' keeps the driver defaults"""
+    if spec == "driver":
+        return None
+    size, _, fps = spec.partition("@")
+    width, height = (int(v) for v in size.lower().split("x"))
+    return width, height, float(fps or 30)
+
+
+def open_source(spec="0", realtime=True, loop=False, buffer_frames=8, capture=(320, 240, 30), reprobe=False):
+    """Open a webcam index ("0"), a video file or a directory of images"""
+    spec = str(spec)
+    if spec.isdigit():
+        return WebcamSource(int(spec), target=capture, reprobe=reprobe)
+    if os.path.isdir(spec):
+        return ImageDirSource(spec, realtime=realtime, loop=loop, buffer_frames=buffer_frames)
+    return VideoFileSource(spec, realtime=realtime, loop=loop, buffer_frames=buffer_frames)
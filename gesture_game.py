@@ -4,16 +4,73 @@ import mediapipe as mp
 import random
 import math
 import os
+import time
+import argparse
+from quality import QualityGovernor, QUALITY_TIERS
+from gestures import GESTURE_PARAMS, GESTURE_NAMES, NONE, OPEN, FIST, GUN, is_fist, is_gun_gesture
+from frame_sources import open_source, parse_capture
+from particles import ParticleSystem
+from parallax import ParallaxBackground
+from memprofile import MemoryProfiler
+from metrics import MetricsRegistry, MetricsServer
+from audio import MIXER_FREQUENCY, MIXER_BUFFER, AudioEngine, open_audio
 # -------------------- Setup --------------------
+parser = argparse.ArgumentParser(description="PalmSprint - gesture controlled runner")
+parser.add_argument("--render-scale", type=int, default=1, choices=[1, 3],
+                    help="Compose the world at 1/N resolution and upscale once (3 = native Kenney pixels)")
+parser.add_argument("--window", default=None, help="Window size as WIDTHxHEIGHT (resizable)")
+parser.add_argument("--fullscreen", action="store_true", help="Run fullscreen at desktop resolution")
+parser.add_argument("--quality", default="auto", choices=["auto"] + [t["name"] for t in QUALITY_TIERS],
+                    help="Fixed quality tier, or 'auto' to adapt to the frame budget")
+parser.add_argument("--input", default="gesture", choices=["gesture", "bot"],
+                    help="Control the player with hand gestures or the autopilot bot")
+parser.add_argument("--source", default="0", help="Webcam index, video file or image directory")
+parser.add_argument("--pacing", default="realtime", choices=["realtime", "fast"],
+                    help="Play file sources at their frame rate or as fast as they decode")
+parser.add_argument("--loop", action="store_true", help="Restart file sources when they end")
+parser.add_argument("--capture", default="320x240@30", metavar="WxH@FPS",
+                    help="Smallest webcam mode to negotiate, or 'driver' for the driver defaults")
+parser.add_argument("--reprobe", action="store_true", help="Probe the webcam's modes again instead of using the cache")
+parser.add_argument("--telemetry", default=None, metavar="DIR", help="Record per-frame telemetry into DIR")
+parser.add_argument("--memprofile", action="store_true", help="Start with memory profiling on (toggle with M)")
+parser.add_argument("--memprofile-interval", type=float, default=60.0, metavar="SECONDS",
+                    help="Seconds between periodic memory snapshots")
+parser.add_argument("--mute", action="store_true", help="Disable sound effects")
+parser.add_argument("--metrics-port", type=int, default=None, metavar="PORT",
+                    help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics")
+args = parser.parse_args()
+
+pygame.mixer.pre_init(MIXER_FREQUENCY, -16, 2, MIXER_BUFFER)
 pygame.init()
-WIDTH, HEIGHT = 800, 400
+WIDTH, HEIGHT = 800, 400  # Logical game units, independent of the window size
 CAM_WIDTH, CAM_HEIGHT = 200, 150
 GROUND_Y = HEIGHT - 96  # Ground level
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+RENDER_SCALE = max(1, args.render_scale)
+if args.fullscreen:
+    screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+elif args.window:
+    win_w, win_h = (int(v) for v in args.window.lower().split("x"))
+    screen = pygame.display.set_mode((win_w, win_h), pygame.RESIZABLE)
+else:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Pixel Runner - Gesture Combat")
 clock = pygame.time.Clock()
 font = pygame.font.Font(None, 36)
 large_font = pygame.font.Font(None, 72)
+status_font = pygame.font.Font(None, 16)
+inst_font = pygame.font.Font(None, 18)
+
+# -------------------- Balance --------------------
+# Difficulty knobs, overridden per parameter set by balance.py
+GAME_PARAMS = {
+    "obstacle_interval": 2.5,
+    "collectible_interval": 1.5,
+    "enemy_interval": 5.0,
+    "enemy_shoot_cooldown": 2.0,
+    "projectile_speed": 8,
+    "jump_strength": -15,
+    "gravity": 0.5,
+}
 
 # -------------------- Colors --------------------
 WHITE = (255, 255, 255)
@@ -23,30 +80,134 @@ LIGHT_BLUE = (200, 230, 255)
 RED = (255, 50, 50)
 YELLOW = (255, 255, 100)
 
+# -------------------- Render Target --------------------
+def px(*values):
+    """Convert logical game units to render-target pixels"""
+    if len(values) == 1:
+        return int(values[0] // RENDER_SCALE)
+    return tuple(int(v // RENDER_SCALE) for v in values)
+
+class RenderTarget:
+    """World surface at 1/RENDER_SCALE resolution, upscaled once into the window.
+
+    The HUD is drawn afterwards at full window resolution on `hud`, a
+    subsurface covering the letterboxed viewport.
+    """
+    def __init__(self, window, scale):
+        self.scale = scale
+        self.world_size = (WIDTH // scale, HEIGHT // scale)
+        self.resize(window)
+
+    def resize(self, window):
+        win_w, win_h = window.get_size()
+        world_w, world_h = self.world_size
+        factor = min(win_w // world_w, win_h // world_h)
+        if factor >= 1:
+            view_size = (world_w * factor, world_h * factor)
+        else:
+            # Window smaller than the world: fall back to a fractional fit
+            ratio = min(win_w / world_w, win_h / world_h)
+            view_size = (max(1, int(world_w * ratio)), max(1, int(world_h * ratio)))
+        self.viewport = pygame.Rect((0, 0), view_size)
+        self.viewport.center = (win_w // 2, win_h // 2)
+
+        window.fill(BLACK)
+        self.hud = window.subsurface(self.viewport)
+        # Same size as the viewport: draw the world straight into the window
+        self.direct = view_size == self.world_size
+        self.world = self.hud if self.direct else pygame.Surface(self.world_size).convert()
+        # transform.scale only has a fast path for exact doubling, so even
+        # factors above 2 go through a half-size surface and finish with it
+        half = factor // 2 if factor > 2 and factor % 2 == 0 else 0
+        self.half = pygame.Surface((world_w * half, world_h * half)).convert() if half else None
+
+    def upscale(self):
+        if self.half:
+            pygame.transform.scale(self.world, self.half.get_size(), self.half)
+            pygame.transform.scale(self.half, self.viewport.size, self.hud)
+        elif not self.direct:
+            pygame.transform.scale(self.world, self.viewport.size, self.hud)
+
+render_target = RenderTarget(screen, RENDER_SCALE)
+
+# -------------------- Quality --------------------
+governor = QualityGovernor()
+if args.quality != "auto":
+    governor.tier = [t["name"] for t in QUALITY_TIERS].index(args.quality)
+
+# -------------------- Particles --------------------
+particles = ParticleSystem(render_scale=RENDER_SCALE)
+
+def emit(x, y, effect, count):
+    """Particle burst in logical coordinates, thinned out on low quality tiers"""
+    particles.burst(x, y, effect, int(count * governor.settings["particles"]))
+
+# -------------------- Metrics --------------------
+# Updated every frame (plain increments); only served with --metrics-port
+metrics = MetricsRegistry()
+frames_counter = metrics.counter("palmsprint_frames_total", "Frames rendered")
+fps_gauge = metrics.gauge("palmsprint_fps", "Frames per second averaged by the pygame clock")
+frame_work_gauge = metrics.gauge("palmsprint_frame_work_seconds",
+                                 "Time of the last frame, excluding camera waits and the frame-cap sleep")
+quality_gauge = metrics.gauge("palmsprint_quality_tier", "Current quality tier (0 = high)")
+camera_frames_counter = metrics.counter("palmsprint_camera_frames_total", "Camera frames read")
+camera_failures_counter = metrics.counter("palmsprint_camera_read_failures_total", "Camera reads returning no frame")
+camera_dropped_counter = metrics.counter("palmsprint_camera_dropped_frames_total", "Stale or late frames skipped by the source")
+inference_histogram = metrics.histogram("palmsprint_inference_seconds", "MediaPipe hand inference latency")
+hands_counter = metrics.counter("palmsprint_hands_detected_total", "Frames with a detected hand", ["hand"])
+gestures_counter = metrics.counter("palmsprint_gestures_total", "Gesture classifications", ["hand", "gesture"])
+entities_gauge = metrics.gauge("palmsprint_entities", "Live entities", ["type"])
+sessions_counter = metrics.counter("palmsprint_sessions_total", "Game sessions started")
+game_overs_counter = metrics.counter("palmsprint_game_overs_total", "Sessions ended", ["cause"])
+score_gauge = metrics.gauge("palmsprint_score", "Score of the current session")
+
+def update_metrics(game, work_ms):
+    frames_counter.inc()
+    fps_gauge.set(clock.get_fps())
+    frame_work_gauge.set(work_ms / 1000)
+    quality_gauge.set(governor.tier)
+    entities_gauge.labels("obstacle").set(len(game.obstacles))
+    entities_gauge.labels("collectible").set(len(game.collectibles))
+    entities_gauge.labels("enemy").set(len(game.enemies))
+    entities_gauge.labels("projectile").set(len(game.projectiles))
+    entities_gauge.labels("particle").set(particles.live_count)
+    score_gauge.set(game.score)
+
 # -------------------- Asset Loading --------------------
 ASSET_PATH = r"C:\Users\zaima\OneDrive\Documents\GitHub\Palm-Sprint\kenney_pixel-platformer"
 TILE_SIZE = 16  # Kenney's tiles are typically 16x16
 
-def load_image(path, scale=3):
-    """Load image with error handling and scaling"""
+def load_image(path, scale=3, hud=False):
+    """Load image with error handling and scaling.
+
+    HUD art keeps the full scale. World art is scaled for the render target
+    to the same logical size at every render scale, so hitboxes never depend
+    on the rendering option; where scale / RENDER_SCALE is fractional (the
+    2x coin at render scale 3) the sprite is resampled to the nearest pixel.
+    """
     try:
         img = pygame.image.load(path).convert_alpha()
-        if scale != 1:
-            new_size = (img.get_width() * scale, img.get_height() * scale)
-            img = pygame.transform.scale(img, new_size)
+        ratio = scale if hud else scale / RENDER_SCALE
+        size = (round(img.get_width() * ratio), round(img.get_height() * ratio))
+        if size != img.get_size():
+            img = pygame.transform.scale(img, size)
         return img
     except Exception as e:
         print(f"Could not load: {path} - {e}")
         return None
 
+def logical_size(img):
+    """Size of a world image in logical game units"""
+    return img.get_width() * RENDER_SCALE, img.get_height() * RENDER_SCALE
+
 # Load specific tiles
 print("Loading Kenney Pixel Platformer assets...")
 ground_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "tile_0082.png"), scale=3)
 coin_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "tile_0067.png"), scale=2)
-heart_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "tile_0044.png"), scale=2)
+heart_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "tile_0044.png"), scale=2, hud=True)
 obstacle_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "tile_0032.png"), scale=3)
 character_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "Characters", "tile_0000.png"), scale=3)
-sky_tile = load_image(os.path.join(ASSET_PATH, "Tiles", "Backgrounds", "tile_0011.png"), scale=1)
+backgrounds_sheet = load_image(os.path.join(ASSET_PATH, "Tilemap", "tilemap-backgrounds_packed.png"), scale=1, hud=True)
 
 player_sprites = {
     'idle': character_tile,
@@ -60,7 +221,42 @@ print(f"✓ Coin tile: {'Loaded' if coin_tile else 'Failed'}")
 print(f"✓ Heart tile: {'Loaded' if heart_tile else 'Failed'}")
 print(f"✓ Obstacle tile: {'Loaded' if obstacle_tile else 'Failed'}")
 print(f"✓ Character tile: {'Loaded' if character_tile else 'Failed'}")
-print(f"✓ Sky tile: {'Loaded' if sky_tile else 'Failed'}")
+print(f"✓ Background tilemap: {'Loaded' if backgrounds_sheet else 'Failed'}")
+
+# Parallax strips are composed once at render-target resolution
+background = ParallaxBackground(backgrounds_sheet, RENDER_SCALE, WIDTH, GROUND_Y) if backgrounds_sheet else None
+
+# Sound effects: sounds/<name>.ogg or .wav if present, otherwise synthesised
+SOUND_PATH = "sounds"
+audio = open_audio(SOUND_PATH, mute=args.mute)
+print(f"✓ Sound effects: {'Muted' if args.mute else 'Loaded' if isinstance(audio, AudioEngine) else 'No audio device'}")
+
+# -------------------- Collision --------------------
+# Masks are in logical units and built once per sprite, shape or rotation step
+mask_cache = {}
+
+def cached_mask(key, build):
+    mask = mask_cache.get(key)
+    if mask is None:
+        mask = mask_cache[key] = build()
+    return mask
+
+def sprite_mask(sprite):
+    """Mask of a world sprite, scaled from render-target pixels to logical size"""
+    return pygame.mask.from_surface(sprite).scale(logical_size(sprite))
+
+def shape_mask(size, draw_shape):
+    """Mask of a shape drawn by `draw_shape(surface)` at logical size"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    draw_shape(surface)
+    return pygame.mask.from_surface(surface)
+
+def collide(a, b):
+    """Pixel-accurate hit test; masks are only compared when the bounding boxes overlap"""
+    rect_a, rect_b = a.get_rect(), b.get_rect()
+    if not rect_a.colliderect(rect_b):
+        return False
+    return a.get_mask().overlap(b.get_mask(), (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is not None
 
 # -------------------- Projectile --------------------
 class Projectile:
@@ -68,7 +264,7 @@ class Projectile:
         self.x = x
         self.y = y
         self.direction = direction  # 1 for right, -1 for left
-        self.speed = 8
+        self.speed = GAME_PARAMS["projectile_speed"]
         self.width = 12
         self.height = 6
         self.shooter = shooter
@@ -79,16 +275,23 @@ class Projectile:
     
     def draw(self, screen):
         # Bullet with glow
-        glow_surf = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-        pygame.draw.ellipse(glow_surf, (*self.color, 80), (0, 0, self.width + 10, self.height + 10))
-        screen.blit(glow_surf, (self.x - 5, self.y - 5))
+        if governor.settings["glow"]:
+            glow_size = px(self.width + 10, self.height + 10)
+            glow_surf = pygame.Surface(glow_size, pygame.SRCALPHA)
+            pygame.draw.ellipse(glow_surf, (*self.color, 80), (0, 0, *glow_size))
+            screen.blit(glow_surf, px(self.x - 5, self.y - 5))
         
-        pygame.draw.ellipse(screen, self.color, (self.x, self.y, self.width, self.height))
-        pygame.draw.ellipse(screen, WHITE, (self.x + 2, self.y + 1, self.width - 6, self.height - 3))
+        pygame.draw.ellipse(screen, self.color, px(self.x, self.y, self.width, self.height))
+        pygame.draw.ellipse(screen, WHITE, px(self.x + 2, self.y + 1, self.width - 6, self.height - 3))
     
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
+    def get_mask(self):
+        size = (self.width, self.height)
+        return cached_mask(("projectile", size), lambda: shape_mask(
+            size, lambda s: pygame.draw.ellipse(s, WHITE, (0, 0, *size))))
+    
     def off_screen(self):
         return self.x < -20 or self.x > WIDTH + 20
 
@@ -102,7 +305,7 @@ class Enemy:
         self.speed = 2
         self.health = 3
         self.shoot_timer = 0
-        self.shoot_cooldown = 2.0
+        self.shoot_cooldown = GAME_PARAMS["enemy_shoot_cooldown"]
         self.color = (180, 50, 50)
         self.flash_timer = 0
         
@@ -122,40 +325,59 @@ class Enemy:
     def take_damage(self):
         self.health -= 1
         self.flash_timer = 0.2
+        center_x, center_y = self.x + self.width / 2, self.y + self.height / 2
+        if self.health <= 0:
+            emit(center_x, center_y, "enemy_death", 48)
+        else:
+            emit(center_x, center_y, "hit", 12)
+        audio.play("hit")
         return self.health <= 0
     
     def draw(self, screen):
         color = WHITE if self.flash_timer > 0 else self.color
         
         # Body
-        pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
-        pygame.draw.rect(screen, (150, 30, 30), (self.x + 4, self.y + 4, self.width - 8, self.height - 8))
+        pygame.draw.rect(screen, color, px(self.x, self.y, self.width, self.height))
+        pygame.draw.rect(screen, (150, 30, 30), px(self.x + 4, self.y + 4, self.width - 8, self.height - 8))
         
         # Eye
         eye_y = self.y + 15
-        pygame.draw.circle(screen, RED, (int(self.x + 15), eye_y), 8)
-        pygame.draw.circle(screen, (255, 100, 100), (int(self.x + 15), eye_y), 5)
+        pygame.draw.circle(screen, RED, px(self.x + 15, eye_y), px(8))
+        pygame.draw.circle(screen, (255, 100, 100), px(self.x + 15, eye_y), px(5))
         
         # Gun barrel
         gun_width = 25
         gun_height = 8
-        pygame.draw.rect(screen, (80, 80, 80), (self.x - gun_width, self.y + self.height // 2 - gun_height // 2, gun_width, gun_height))
-        pygame.draw.circle(screen, (100, 100, 100), (int(self.x - gun_width), int(self.y + self.height // 2)), 6)
+        pygame.draw.rect(screen, (80, 80, 80), px(self.x - gun_width, self.y + self.height // 2 - gun_height // 2, gun_width, gun_height))
+        pygame.draw.circle(screen, (100, 100, 100), px(self.x - gun_width, self.y + self.height // 2), px(6))
         
         # Health bar
         bar_width = self.width
         bar_height = 6
-        pygame.draw.rect(screen, (80, 80, 80), (self.x, self.y - 15, bar_width, bar_height))
+        pygame.draw.rect(screen, (80, 80, 80), px(self.x, self.y - 15, bar_width, bar_height))
         health_width = (self.health / 3) * bar_width
-        pygame.draw.rect(screen, (255, 50, 50), (self.x, self.y - 15, health_width, bar_height))
+        pygame.draw.rect(screen, (255, 50, 50), px(self.x, self.y - 15, health_width, bar_height))
         
         # Shadow
-        shadow_surf = pygame.Surface((self.width, 8), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 80), (0, 0, self.width, 8))
-        screen.blit(shadow_surf, (self.x, GROUND_Y + 2))
+        if governor.settings["shadows"]:
+            shadow_size = px(self.width, 8)
+            shadow_surf = pygame.Surface(shadow_size, pygame.SRCALPHA)
+            pygame.draw.ellipse(shadow_surf, (0, 0, 0, 80), (0, 0, *shadow_size))
+            screen.blit(shadow_surf, px(self.x, GROUND_Y + 2))
+    
+    GUN_REACH = 31  # Barrel (25) plus muzzle radius (6) in front of the body
     
     def get_rect(self):
-        return pygame.Rect(self.x + 5, self.y + 5, self.width - 10, self.height - 5)
+        return pygame.Rect(self.x - self.GUN_REACH, self.y, self.width + self.GUN_REACH, self.height)
+    
+    def get_mask(self):
+        def draw_shape(surface):
+            reach, mid = self.GUN_REACH, self.height // 2
+            pygame.draw.rect(surface, WHITE, (reach, 0, self.width, self.height))
+            pygame.draw.rect(surface, WHITE, (reach - 25, mid - 4, 25, 8))
+            pygame.draw.circle(surface, WHITE, (reach - 25, mid), 6)
+        return cached_mask(("enemy", self.width, self.height),
+                           lambda: shape_mask((self.width + self.GUN_REACH, self.height), draw_shape))
     
     def off_screen(self):
         return self.x < -self.width
@@ -167,8 +389,8 @@ class Player:
         self.width = 48
         self.height = 48
         self.y_velocity = 0
-        self.gravity = 0.5
-        self.jump_strength = -15
+        self.gravity = GAME_PARAMS["gravity"]
+        self.jump_strength = GAME_PARAMS["jump_strength"]
         self.is_jumping = False
         self.is_ducking = False
         self.run_frame = 0
@@ -184,6 +406,7 @@ class Player:
         if not self.is_jumping and not self.is_ducking:
             self.y_velocity = self.jump_strength
             self.is_jumping = True
+            audio.play("jump")
     
     def force_fall(self):
         if self.is_jumping:
@@ -206,6 +429,7 @@ class Player:
     def shoot(self):
         if self.can_shoot():
             self.shoot_timer = self.shoot_cooldown
+            audio.play("shoot")
             shoot_y = self.y + self.height // 2 if not self.is_ducking else self.y + 15
             return Projectile(self.x + self.width, shoot_y, 1, "player")
         return None
@@ -215,6 +439,8 @@ class Player:
             self.health -= 1
             self.invulnerable = True
             self.invuln_timer = 2.0  # 2 seconds invulnerability
+            emit(self.x + self.width / 2, self.y + self.height / 2, "player_hit", 24)
+            audio.play("hurt")
             return self.health <= 0
         return False
     
@@ -250,18 +476,28 @@ class Player:
         sprite = character_tile
         
         if sprite:
-            screen.blit(sprite, (self.x, self.y))
+            screen.blit(sprite, px(self.x, self.y))
         else:
             color = (100, 200, 255)
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, color, px(self.x, self.y, self.width, self.height))
         
         # Shadow
-        shadow_surf = pygame.Surface((self.width, 8), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, self.width, 8))
-        screen.blit(shadow_surf, (self.x, GROUND_Y + 2))
+        if governor.settings["shadows"]:
+            shadow_size = px(self.width, 8)
+            shadow_surf = pygame.Surface(shadow_size, pygame.SRCALPHA)
+            pygame.draw.ellipse(shadow_surf, (0, 0, 0, 60), (0, 0, *shadow_size))
+            screen.blit(shadow_surf, px(self.x, GROUND_Y + 2))
     
     def get_rect(self):
-        return pygame.Rect(self.x + 8, self.y + 5, self.width - 16, self.height - 10)
+        if character_tile:
+            return pygame.Rect((self.x, self.y), logical_size(character_tile))
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+    
+    def get_mask(self):
+        if character_tile:
+            return cached_mask(character_tile, lambda: sprite_mask(character_tile))
+        size = (self.width, self.height)
+        return cached_mask(("player", size), lambda: pygame.mask.Mask(size, fill=True))
 
 # -------------------- Obstacle --------------------
 class Obstacle:
@@ -276,8 +512,7 @@ class Obstacle:
             self.y = 0
         else:
             if obstacle_tile:
-                self.width = obstacle_tile.get_width()
-                self.height = obstacle_tile.get_height()
+                self.width, self.height = logical_size(obstacle_tile)
             else:
                 self.width = 40
                 self.height = 60
@@ -290,31 +525,49 @@ class Obstacle:
     def draw(self, screen):
         if self.type == "air":
             # Hanging obstacle
-            pygame.draw.rect(screen, (180, 60, 60), (self.x, self.y, self.width, self.height))
-            pygame.draw.rect(screen, (220, 100, 100), (self.x + 4, self.y, 4, self.height))
+            pygame.draw.rect(screen, (180, 60, 60), px(self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, (220, 100, 100), px(self.x + 4, self.y, 4, self.height))
             # Spikes at bottom
-            spike_points = []
-            for i in range(5):
-                spike_x = self.x + (self.width / 5) * i
-                spike_points.append((spike_x, self.height))
-                spike_points.append((spike_x + self.width/10, self.height + 10))
-            if len(spike_points) > 2:
-                pygame.draw.polygon(screen, (150, 40, 40), spike_points[:6])
+            pygame.draw.polygon(screen, (150, 40, 40), [px(x, y) for x, y in self.spike_points(self.x)])
         else:
             if obstacle_tile:
-                screen.blit(obstacle_tile, (self.x, self.y))
+                screen.blit(obstacle_tile, px(self.x, self.y))
             else:
-                pygame.draw.rect(screen, (200, 80, 80), (self.x, self.y, self.width, self.height))
+                pygame.draw.rect(screen, (200, 80, 80), px(self.x, self.y, self.width, self.height))
             
             # Shadow
-            shadow_surf = pygame.Surface((self.width, 8), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surf, (0, 0, 0, 80), (0, 0, self.width, 8))
-            screen.blit(shadow_surf, (self.x, GROUND_Y + 2))
+            if governor.settings["shadows"]:
+                shadow_size = px(self.width, 8)
+                shadow_surf = pygame.Surface(shadow_size, pygame.SRCALPHA)
+                pygame.draw.ellipse(shadow_surf, (0, 0, 0, 80), (0, 0, *shadow_size))
+                screen.blit(shadow_surf, px(self.x, GROUND_Y + 2))
+    
+    def spike_points(self, x):
+        """Spike polygon under an air obstacle whose left edge is at `x`; shared by draw() and the mask"""
+        points = []
+        for i in range(5):
+            spike_x = x + (self.width / 5) * i
+            points.append((spike_x, self.height))
+            points.append((spike_x + self.width/10, self.height + 10))
+        return points[:6]
     
     def get_rect(self):
         if self.type == "air":
-            return pygame.Rect(self.x + 8, 0, self.width - 16, self.height + 10)
-        return pygame.Rect(self.x + 8, self.y + 5, self.width - 16, self.height - 5)
+            return pygame.Rect(self.x, self.y, self.width, self.height + 10)  # Spike hangs 10 below
+        return pygame.Rect(self.x, self.y, self.width, self.height)
+    
+    def get_mask(self):
+        if self.type == "air":
+            def draw_shape(surface):
+                w, h = self.width, self.height
+                pygame.draw.rect(surface, WHITE, (0, 0, w, h))
+                pygame.draw.polygon(surface, WHITE, self.spike_points(0))
+            return cached_mask(("air", self.width, self.height),
+                               lambda: shape_mask((self.width, self.height + 10), draw_shape))
+        if obstacle_tile:
+            return cached_mask(obstacle_tile, lambda: sprite_mask(obstacle_tile))
+        size = (self.width, self.height)
+        return cached_mask(("obstacle", size), lambda: pygame.mask.Mask(size, fill=True))
     
     def off_screen(self):
         return self.x < -self.width
@@ -335,8 +588,7 @@ class Collectible:
         self.float_offset = 0
         
         if coin_tile:
-            self.width = coin_tile.get_width()
-            self.height = coin_tile.get_height()
+            self.width, self.height = logical_size(coin_tile)
         else:
             self.width = 24
             self.height = 24
@@ -351,366 +603,514 @@ class Collectible:
         
         if coin_tile:
             # Rotate the coin for visual effect
-            rotated = pygame.transform.rotate(coin_tile, self.angle)
-            rect = rotated.get_rect(center=(self.x, y_pos))
+            rotated = self.sprite()
+            rect = rotated.get_rect(center=px(self.x, y_pos))
             
             # Glow effect
-            glow_surf = pygame.Surface((self.width + 20, self.height + 20), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (255, 255, 150, 60), 
-                             (self.width//2 + 10, self.height//2 + 10), self.width//2 + 10)
-            screen.blit(glow_surf, (rect.centerx - self.width//2 - 10, rect.centery - self.height//2 - 10))
+            if governor.settings["glow"]:
+                glow_radius = px(self.width//2 + 10)
+                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(glow_surf, (255, 255, 150, 60), (glow_radius, glow_radius), glow_radius)
+                screen.blit(glow_surf, (rect.centerx - glow_radius, rect.centery - glow_radius))
             
             screen.blit(rotated, rect)
         else:
-            pygame.draw.circle(screen, (255, 255, 100), (self.x, y_pos), 12)
-            pygame.draw.circle(screen, (255, 215, 0), (self.x, y_pos), 10)
+            pygame.draw.circle(screen, (255, 255, 100), px(self.x, y_pos), px(12))
+            pygame.draw.circle(screen, (255, 215, 0), px(self.x, y_pos), px(10))
+    
+    rotations = {}  # angle -> rotated coin sprite, shared by every coin
+    
+    def sprite(self):
+        angle = self.angle if governor.settings["coin_rotation"] else 0
+        rotated = self.rotations.get(angle)
+        if rotated is None:
+            rotated = self.rotations[angle] = pygame.transform.rotate(coin_tile, angle)
+        return rotated
     
     def get_rect(self):
-        return pygame.Rect(self.x - self.width//2, self.y - self.height//2, self.width, self.height)
+        # Centred on the floating draw position; rotation grows the box
+        width, height = logical_size(self.sprite()) if coin_tile else (24, 24)
+        y_pos = int(self.y + self.float_offset)
+        return pygame.Rect(self.x - width // 2, y_pos - height // 2, width, height)
+    
+    def get_mask(self):
+        if coin_tile:
+            rotated = self.sprite()
+            return cached_mask(rotated, lambda: sprite_mask(rotated))
+        return cached_mask("coin", lambda: shape_mask((24, 24), lambda s: pygame.draw.circle(s, WHITE, (12, 12), 12)))
     
     def off_screen(self):
         return self.x < -self.width
 
-# -------------------- MediaPipe --------------------
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands = mp_hands.Hands(max_num_hands=2, min_detection_confidence=0.7)
-cap = cv2.VideoCapture(0)
-
-def is_fist(hand_landmarks):
-    tips = [8, 12, 16, 20]
-    pips = [6, 10, 14, 18]
-    folded = 0
-    for tip, pip in zip(tips, pips):
-        if hand_landmarks.landmark[tip].y > hand_landmarks.landmark[pip].y:
-            folded += 1
-    return folded >= 3
-
-def is_gun_gesture(hand_landmarks):
-    # Gun gesture: index and thumb extended, others folded
-    index_tip = hand_landmarks.landmark[8]
-    index_pip = hand_landmarks.landmark[6]
-    thumb_tip = hand_landmarks.landmark[4]
-    thumb_ip = hand_landmarks.landmark[3]
-    middle_tip = hand_landmarks.landmark[12]
-    middle_pip = hand_landmarks.landmark[10]
-    ring_tip = hand_landmarks.landmark[16]
-    ring_pip = hand_landmarks.landmark[14]
-    pinky_tip = hand_landmarks.landmark[20]
-    pinky_pip = hand_landmarks.landmark[18]
-    
-    # Index extended
-    index_extended = index_tip.y < index_pip.y
-    # Thumb extended
-    thumb_extended = thumb_tip.x < thumb_ip.x or thumb_tip.x > thumb_ip.x  # Check if thumb is out
-    # Middle, ring, pinky folded
-    middle_folded = middle_tip.y > middle_pip.y
-    ring_folded = ring_tip.y > ring_pip.y
-    pinky_folded = pinky_tip.y > pinky_pip.y
-    
-    return index_extended and (middle_folded or ring_folded or pinky_folded)
-
-# -------------------- Game Variables --------------------
-player = Player()
-obstacles = []
-collectibles = []
-enemies = []
-projectiles = []
-score = 0
-game_over = False
-obstacle_timer = 0
-collectible_timer = 0
-enemy_timer = 0
-gesture_speed = 3
-ground_scroll = 0
-
-# -------------------- Game Loop --------------------
-running = True
-while running:
-    dt = clock.tick(60) / 1000.0
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                if game_over:
-                    player = Player()
-                    obstacles = []
-                    collectibles = []
-                    enemies = []
-                    projectiles = []
-                    score = 0
-                    game_over = False
-                    obstacle_timer = 0
-                    collectible_timer = 0
-                    enemy_timer = 0
-                else:
-                    player.jump()
-            if event.key == pygame.K_DOWN:
-                player.duck()
-            if event.key == pygame.K_f:  # F key to shoot (backup)
-                bullet = player.shoot()
-                if bullet:
-                    projectiles.append(bullet)
-        if event.type == pygame.KEYUP:
-            if event.key == pygame.K_DOWN:
-                player.stand()
-    
-    if not game_over:
-        # Hand Input
-        ret, frame = cap.read()
-        if ret:
-            frame = cv2.flip(frame, 1)
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = hands.process(rgb)
-            
-            gesture_speed = 3
-            jump_command = False
-            duck_command = False
-            shoot_command = False
-            left_hand_status = "No hand"
-            right_hand_status = "No hand"
-            
-            if results.multi_hand_landmarks:
-                for hand_landmarks, hand_info in zip(results.multi_hand_landmarks, results.multi_handedness):
-                    label = hand_info.classification[0].label
-                    
-                    mp_drawing.draw_landmarks(rgb, hand_landmarks, mp_hands.HAND_CONNECTIONS,
-                        mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
-                        mp_drawing.DrawingSpec(color=(255, 255, 0), thickness=2))
-                    
-                    if label == "Right":
-                        if is_gun_gesture(hand_landmarks):
-                            shoot_command = True
-                            right_hand_status = "GUN - SHOOT!"
-                        elif is_fist(hand_landmarks):
-                            gesture_speed = 2
-                            right_hand_status = "FIST - SLOW"
-                        else:
-                            gesture_speed = 5
-                            right_hand_status = "OPEN - FAST"
-                    
-                    if label == "Left":
-                        if not is_fist(hand_landmarks):
-                            jump_command = True
-                            left_hand_status = "OPEN - JUMP!"
-                        else:
-                            duck_command = True
-                            left_hand_status = "FIST - DUCK!"
-            
-            frame_resized = cv2.resize(rgb, (CAM_WIDTH, CAM_HEIGHT))
-            frame_surface = pygame.surfarray.make_surface(frame_resized.swapaxes(0, 1))
-            
-            if jump_command:
-                player.jump()
-            if duck_command:
-                player.force_fall()
-                player.duck()
-            else:
-                player.stand()
-            
-            if shoot_command:
-                bullet = player.shoot()
-                if bullet:
-                    projectiles.append(bullet)
-        
+# -------------------- Game --------------------
+class Game:
+    """One play session: entities, spawn timers, score and scrolling"""
+    def __init__(self):
+        self.player = Player()
+        self.obstacles = []
+        self.collectibles = []
+        self.enemies = []
+        self.projectiles = []
+        self.score = 0
+        self.game_over = False
+        self.death_cause = None
+        self.collisions = 0
+        self.time_alive = 0.0
+        self.obstacle_timer = 0
+        self.collectible_timer = 0
+        self.enemy_timer = 0
+        self.gesture_speed = 3
+        self.ground_scroll = 0
+        self.distance = 0  # Total ground scroll, drives the parallax layers
+    
+    def apply_controls(self, controls):
+        """Apply jump/duck/shoot/speed commands from an input driver"""
+        self.gesture_speed = controls["speed"]
+        if controls["jump"]:
+            self.player.jump()
+        if controls["duck"]:
+            self.player.force_fall()
+            self.player.duck()
+        else:
+            self.player.stand()
+        if controls["shoot"]:
+            self.shoot()
+    
+    def shoot(self):
+        bullet = self.player.shoot()
+        if bullet:
+            self.projectiles.append(bullet)
+    
+    def damage_player(self, cause):
+        self.collisions += 1
+        if self.player.take_damage():
+            self.game_over = True
+            self.death_cause = cause
+            emit(self.player.x + self.player.width / 2, self.player.y + self.player.height / 2, "game_over", 160)
+            audio.play("game_over")
+    
+    def update(self, dt):
+        player = self.player
+        gesture_speed = self.gesture_speed
+        self.time_alive += dt
         player.update(dt)
         
         # Scroll ground
-        ground_scroll = (ground_scroll + gesture_speed) % 48
+        self.ground_scroll = (self.ground_scroll + gesture_speed) % 48
+        self.distance += gesture_speed
         
         # Spawn obstacles
-        obstacle_timer += dt
-        if obstacle_timer > 2.5:
+        self.obstacle_timer += dt
+        if self.obstacle_timer > GAME_PARAMS["obstacle_interval"]:
             obstacle_type = random.choice(["ground", "ground", "air"])
-            obstacles.append(Obstacle(WIDTH, obstacle_type))
-            obstacle_timer = 0
+            self.obstacles.append(Obstacle(WIDTH, obstacle_type))
+            self.obstacle_timer = 0
         
         # Spawn collectibles
-        collectible_timer += dt
-        if collectible_timer > 1.5:
-            collectibles.append(Collectible(WIDTH))
-            collectible_timer = 0
+        self.collectible_timer += dt
+        if self.collectible_timer > GAME_PARAMS["collectible_interval"]:
+            self.collectibles.append(Collectible(WIDTH))
+            self.collectible_timer = 0
         
         # Spawn enemies
-        enemy_timer += dt
-        if enemy_timer > 5.0:
-            enemies.append(Enemy(WIDTH))
-            enemy_timer = 0
+        self.enemy_timer += dt
+        if self.enemy_timer > GAME_PARAMS["enemy_interval"]:
+            self.enemies.append(Enemy(WIDTH))
+            self.enemy_timer = 0
         
         # Update obstacles
-        for obstacle in obstacles[:]:
+        for obstacle in self.obstacles[:]:
             obstacle.speed = gesture_speed
             obstacle.update()
-            if player.get_rect().colliderect(obstacle.get_rect()):
-                if player.take_damage():
-                    game_over = True
+            if collide(player, obstacle):
+                self.damage_player(f"obstacle_{obstacle.type}")
             if obstacle.off_screen():
-                obstacles.remove(obstacle)
+                self.obstacles.remove(obstacle)
         
         # Update collectibles
-        for collectible in collectibles[:]:
+        for collectible in self.collectibles[:]:
             collectible.speed = gesture_speed
             collectible.update()
-            if not collectible.collected and player.get_rect().colliderect(collectible.get_rect()):
+            if not collectible.collected and collide(player, collectible):
+                self.collisions += 1
                 collectible.collected = True
-                score += 10
-                collectibles.remove(collectible)
+                emit(collectible.x, collectible.y + collectible.float_offset, "coin", 20)
+                audio.play("coin")
+                self.score += 10
+                self.collectibles.remove(collectible)
             if collectible.off_screen():
-                collectibles.remove(collectible)
+                self.collectibles.remove(collectible)
         
         # Update enemies
-        for enemy in enemies[:]:
+        for enemy in self.enemies[:]:
             enemy.speed = gesture_speed
             enemy.update(dt)
             
             # Enemy shoots
             if enemy.can_shoot() and enemy.x < WIDTH - 100:
-                projectiles.append(enemy.shoot())
+                self.projectiles.append(enemy.shoot())
             
             # Check collision with player
-            if player.get_rect().colliderect(enemy.get_rect()):
-                if player.take_damage():
-                    game_over = True
+            if collide(player, enemy):
+                self.damage_player("enemy_contact")
             
             if enemy.off_screen():
-                enemies.remove(enemy)
+                self.enemies.remove(enemy)
         
         # Update projectiles
-        for projectile in projectiles[:]:
+        for projectile in self.projectiles[:]:
             projectile.update()
             
             # Check projectile collisions
             if projectile.shooter == "player":
                 # Check hit on enemies
-                for enemy in enemies[:]:
-                    if projectile.get_rect().colliderect(enemy.get_rect()):
+                for enemy in self.enemies[:]:
+                    if collide(projectile, enemy):
+                        self.collisions += 1
                         if enemy.take_damage():
-                            enemies.remove(enemy)
-                            score += 50
-                        projectiles.remove(projectile)
+                            self.enemies.remove(enemy)
+                            self.score += 50
+                        self.projectiles.remove(projectile)
                         break
             else:  # Enemy projectile
                 # Check hit on player
-                if projectile.get_rect().colliderect(player.get_rect()):
-                    if player.take_damage():
-                        game_over = True
-                    projectiles.remove(projectile)
+                if collide(projectile, player):
+                    self.damage_player("enemy_projectile")
+                    self.projectiles.remove(projectile)
             
             if projectile.off_screen():
-                projectiles.remove(projectile)
+                self.projectiles.remove(projectile)
+
+# -------------------- Gesture Input --------------------
+mp_hands = mp.solutions.hands
+mp_drawing = mp.solutions.drawing_utils
+
+class GestureInput:
+    """Camera (or recorded clip) + MediaPipe input driver producing jump/duck/shoot/speed controls"""
+    def __init__(self, source="0"):
+        self.hands = mp_hands.Hands(max_num_hands=2, min_detection_confidence=GESTURE_PARAMS["detection_confidence"])
+        self.cap = open_source(source, realtime=args.pacing == "realtime", loop=args.loop,
+                               capture=parse_capture(args.capture), reprobe=args.reprobe)
+        self.frame_count = 0
+        self.frame_surface = None
+        self.has_frame = False
+        self.left_hand_status = "No hand"
+        self.right_hand_status = "No hand"
+        self.left_gesture = NONE
+        self.right_gesture = NONE
+        self.read_time = 0.0  # Seconds the last poll spent blocked on the camera
     
-    # -------------------- Render --------------------
-    # Sky gradient
-    for y in range(GROUND_Y):
-        ratio = y / GROUND_Y
-        r = int(135 + (200 - 135) * ratio)
-        g = int(206 + (230 - 206) * ratio)
-        b = int(250 + (255 - 250) * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (WIDTH, y))
+    def poll(self, game):
+        """Read one camera frame; returns controls, or None when no frame was read"""
+        start = time.perf_counter()
+        ret, frame = self.cap.read()
+        self.read_time = time.perf_counter() - start
+        self.has_frame = ret
+        camera_dropped_counter.set(getattr(self.cap, "dropped", 0))
+        if not ret:
+            camera_failures_counter.inc()
+            return None
+        camera_frames_counter.inc()
+        self.frame_count += 1
+        
+        frame = cv2.flip(frame, 1)
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        start = time.perf_counter()
+        results = self.hands.process(rgb)
+        inference_histogram.observe(time.perf_counter() - start)
+        
+        controls = {"jump": False, "duck": False, "shoot": False, "speed": 3}
+        self.left_hand_status = "No hand"
+        self.right_hand_status = "No hand"
+        self.left_gesture = NONE
+        self.right_gesture = NONE
+        
+        # Preview and landmark overlay only refresh every Nth frame on low tiers
+        update_preview = self.frame_surface is None or self.frame_count % governor.settings["preview_every"] == 0
+        
+        if results.multi_hand_landmarks:
+            for hand_landmarks, hand_info in zip(results.multi_hand_landmarks, results.multi_handedness):
+                label = hand_info.classification[0].label
+                
+                if update_preview:
+                    mp_drawing.draw_landmarks(rgb, hand_landmarks, mp_hands.HAND_CONNECTIONS,
+                        mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=3),
+                        mp_drawing.DrawingSpec(color=(255, 255, 0), thickness=2))
+                
+                if label == "Right":
+                    if is_gun_gesture(hand_landmarks):
+                        controls["shoot"] = True
+                        self.right_hand_status = "GUN - SHOOT!"
+                        self.right_gesture = GUN
+                    elif is_fist(hand_landmarks):
+                        controls["speed"] = 2
+                        self.right_hand_status = "FIST - SLOW"
+                        self.right_gesture = FIST
+                    else:
+                        controls["speed"] = 5
+                        self.right_hand_status = "OPEN - FAST"
+                        self.right_gesture = OPEN
+                
+                if label == "Left":
+                    if not is_fist(hand_landmarks):
+                        controls["jump"] = True
+                        self.left_hand_status = "OPEN - JUMP!"
+                        self.left_gesture = OPEN
+                    else:
+                        controls["duck"] = True
+                        self.left_hand_status = "FIST - DUCK!"
+                        self.left_gesture = FIST
+        
+        for hand, gesture in (("left", self.left_gesture), ("right", self.right_gesture)):
+            if gesture != NONE:
+                hands_counter.labels(hand).inc()
+                gestures_counter.labels(hand, GESTURE_NAMES[gesture].lower()).inc()
+        
+        if update_preview:
+            preview_scale = governor.settings["preview_scale"]
+            preview_size = (int(CAM_WIDTH * preview_scale), int(CAM_HEIGHT * preview_scale))
+            frame_resized = cv2.resize(rgb, preview_size)
+            self.frame_surface = pygame.surfarray.make_surface(frame_resized.swapaxes(0, 1))
+            if preview_scale != 1:
+                self.frame_surface = pygame.transform.scale(self.frame_surface, (CAM_WIDTH, CAM_HEIGHT))
+        
+        return controls
+    
+    def close(self):
+        self.cap.release()
+
+# -------------------- Render --------------------
+def draw(game, controller):
+    player = game.player
+    ground_scroll = game.ground_scroll
+    
+    # World layer, composed at render-target resolution
+    world = render_target.world
+    world_w, world_h = render_target.world_size
+    
+    # Parallax background
+    if background:
+        background.draw(world, game.distance, governor.settings["background_layers"])
+    else:
+        world.fill(SKY_BLUE)
     
     # Draw ground with tiles
     if ground_tile:
         tile_width = ground_tile.get_width()
-        for x in range(-tile_width, WIDTH + tile_width, tile_width):
-            tile_x = x - ground_scroll
-            screen.blit(ground_tile, (tile_x, GROUND_Y))
-            screen.blit(ground_tile, (tile_x, GROUND_Y + 48))
+        for x in range(-tile_width, world_w + tile_width, tile_width):
+            tile_x = x - px(ground_scroll)
+            world.blit(ground_tile, (tile_x, px(GROUND_Y)))
+            world.blit(ground_tile, (tile_x, px(GROUND_Y + 48)))
     else:
-        pygame.draw.rect(screen, (100, 200, 100), (0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
+        pygame.draw.rect(world, (100, 200, 100), px(0, GROUND_Y, WIDTH, HEIGHT - GROUND_Y))
     
     # Ground line
-    pygame.draw.line(screen, (80, 160, 80), (0, GROUND_Y), (WIDTH, GROUND_Y), 2)
-    
-    # Clouds
-    for cx in [100, 300, 500, 700]:
-        cloud_x = (cx + ground_scroll * 0.3) % (WIDTH + 100)
-        pygame.draw.ellipse(screen, WHITE, (cloud_x, 50, 60, 25))
-        pygame.draw.ellipse(screen, WHITE, (cloud_x + 15, 45, 50, 25))
-        pygame.draw.ellipse(screen, WHITE, (cloud_x + 30, 50, 40, 20))
+    pygame.draw.line(world, (80, 160, 80), px(0, GROUND_Y), px(WIDTH, GROUND_Y), max(1, px(2)))
     
     # Draw game objects
-    for obstacle in obstacles:
-        obstacle.draw(screen)
+    for obstacle in game.obstacles:
+        obstacle.draw(world)
     
-    for collectible in collectibles:
-        collectible.draw(screen)
+    for collectible in game.collectibles:
+        collectible.draw(world)
     
-    for enemy in enemies:
-        enemy.draw(screen)
+    for enemy in game.enemies:
+        enemy.draw(world)
     
-    for projectile in projectiles:
-        projectile.draw(screen)
+    for projectile in game.projectiles:
+        projectile.draw(world)
     
-    player.draw(screen)
+    player.draw(world)
+    particles.draw(world)
+    
+    # Single upscale pass, then the HUD at full resolution on top
+    render_target.upscale()
+    hud = render_target.hud
+    hud_w, hud_h = hud.get_size()
     
     # Camera feed
-    if ret:
-        cam_x, cam_y = WIDTH - CAM_WIDTH - 10, 10
-        pygame.draw.rect(screen, WHITE, (cam_x - 3, cam_y - 3, CAM_WIDTH + 6, CAM_HEIGHT + 6), 3)
-        screen.blit(frame_surface, (cam_x, cam_y))
-        
-        status_font = pygame.font.Font(None, 16)
+    if controller.has_frame:
+        cam_x, cam_y = hud_w - CAM_WIDTH - 10, 10
+        pygame.draw.rect(hud, WHITE, (cam_x - 3, cam_y - 3, CAM_WIDTH + 6, CAM_HEIGHT + 6), 3)
+        hud.blit(controller.frame_surface, (cam_x, cam_y))
         
-        left_color = (0, 255, 0) if "JUMP" in left_hand_status else (255, 100, 255) if "DUCK" in left_hand_status else WHITE
-        left_text = status_font.render(f"L: {left_hand_status}", True, left_color)
+        left_color = (0, 255, 0) if "JUMP" in controller.left_hand_status else (255, 100, 255) if "DUCK" in controller.left_hand_status else WHITE
+        left_text = status_font.render(f"L: {controller.left_hand_status}", True, left_color)
         left_bg = pygame.Surface((left_text.get_width() + 8, left_text.get_height() + 4))
         left_bg.fill(BLACK)
         left_bg.set_alpha(180)
-        screen.blit(left_bg, (cam_x + 3, cam_y + 3))
-        screen.blit(left_text, (cam_x + 7, cam_y + 5))
+        hud.blit(left_bg, (cam_x + 3, cam_y + 3))
+        hud.blit(left_text, (cam_x + 7, cam_y + 5))
         
-        right_color = (255, 255, 0) if "SHOOT" in right_hand_status else (255, 165, 0) if "FAST" in right_hand_status else (100, 100, 255) if "SLOW" in right_hand_status else WHITE
-        right_text = status_font.render(f"R: {right_hand_status}", True, right_color)
+        right_color = (255, 255, 0) if "SHOOT" in controller.right_hand_status else (255, 165, 0) if "FAST" in controller.right_hand_status else (100, 100, 255) if "SLOW" in controller.right_hand_status else WHITE
+        right_text = status_font.render(f"R: {controller.right_hand_status}", True, right_color)
         right_bg = pygame.Surface((right_text.get_width() + 8, right_text.get_height() + 4))
         right_bg.fill(BLACK)
         right_bg.set_alpha(180)
-        screen.blit(right_bg, (cam_x + 3, cam_y + 23))
-        screen.blit(right_text, (cam_x + 7, cam_y + 25))
+        hud.blit(right_bg, (cam_x + 3, cam_y + 23))
+        hud.blit(right_text, (cam_x + 7, cam_y + 25))
     
     # Score
-    score_text = font.render(f"Score: {score}", True, (255, 200, 50))
+    score_text = font.render(f"Score: {game.score}", True, (255, 200, 50))
     score_bg = pygame.Surface((score_text.get_width() + 20, score_text.get_height() + 10))
     score_bg.fill(BLACK)
     score_bg.set_alpha(150)
-    screen.blit(score_bg, (10, 10))
-    screen.blit(score_text, (20, 15))
+    hud.blit(score_bg, (10, 10))
+    hud.blit(score_text, (20, 15))
     
     # Health display
     if heart_tile:
         for i in range(player.health):
-            screen.blit(heart_tile, (20 + i * 40, 60))
+            hud.blit(heart_tile, (20 + i * 40, 60))
     else:
         health_text = font.render(f"Health: {player.health}", True, (255, 50, 50))
-        screen.blit(health_text, (20, 60))
+        hud.blit(health_text, (20, 60))
     
     # Instructions
-    inst_font = pygame.font.Font(None, 18)
     inst1 = inst_font.render("Left: Open=Jump, Fist=Duck", True, WHITE)
     inst2 = inst_font.render("Right: Open=Fast, Fist=Slow", True, WHITE)
     inst_bg = pygame.Surface((250, 50))
     inst_bg.fill(BLACK)
     inst_bg.set_alpha(150)
-    screen.blit(inst_bg, (WIDTH - 260, HEIGHT - 60))
-    screen.blit(inst1, (WIDTH - 250, HEIGHT - 55))
-    screen.blit(inst2, (WIDTH - 250, HEIGHT - 35))
+    hud.blit(inst_bg, (hud_w - 260, hud_h - 60))
+    hud.blit(inst1, (hud_w - 250, hud_h - 55))
+    hud.blit(inst2, (hud_w - 250, hud_h - 35))
     
-    if game_over:
-        overlay = pygame.Surface((WIDTH, HEIGHT))
+    if game.game_over:
+        overlay = pygame.Surface((hud_w, hud_h))
         overlay.fill(BLACK)
         overlay.set_alpha(200)
-        screen.blit(overlay, (0, 0))
+        hud.blit(overlay, (0, 0))
         
         game_over_text = large_font.render("GAME OVER", True, (255, 100, 100))
-        final_score_text = font.render(f"Final Score: {score // 10}", True, (255, 200, 50))
+        final_score_text = font.render(f"Final Score: {game.score // 10}", True, (255, 200, 50))
         restart_text = font.render("Press SPACE to Restart", True, WHITE)
         
-        screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 80))
-        screen.blit(final_score_text, (WIDTH // 2 - final_score_text.get_width() // 2, HEIGHT // 2))
-        screen.blit(restart_text, (WIDTH // 2 - restart_text.get_width() // 2, HEIGHT // 2 + 60))
+        hud.blit(game_over_text, (hud_w // 2 - game_over_text.get_width() // 2, hud_h // 2 - 80))
+        hud.blit(final_score_text, (hud_w // 2 - final_score_text.get_width() // 2, hud_h // 2))
+        hud.blit(restart_text, (hud_w // 2 - restart_text.get_width() // 2, hud_h // 2 + 60))
+
+# -------------------- Telemetry --------------------
+def record_frame(recorder, session, frame_count, game, controller, controls, dt, work_ms):
+    player = game.player
+    controls = controls or {}
+    recorder.record(
+        session=session,
+        frame=frame_count,
+        dt_ms=dt * 1000,
+        frame_ms=work_ms,
+        player_y=player.y,
+        player_vy=player.y_velocity,
+        player_health=player.health,
+        jumping=player.is_jumping,
+        ducking=player.is_ducking,
+        gesture_speed=game.gesture_speed,
+        left_gesture=controller.left_gesture,
+        right_gesture=controller.right_gesture,
+        jump_cmd=controls.get("jump", False),
+        duck_cmd=controls.get("duck", False),
+        shoot_cmd=controls.get("shoot", False),
+        obstacles=len(game.obstacles),
+        collectibles=len(game.collectibles),
+        enemies=len(game.enemies),
+        projectiles=len(game.projectiles),
+        collisions=game.collisions,
+        score=game.score,
+        quality_tier=governor.tier,
+        game_over=game.game_over,
+    )
+
+# -------------------- Game Loop --------------------
+def make_input(name):
+    if name == "bot":
+        from autopilot import BotInput
+        return BotInput()
+    return GestureInput(args.source)
+
+def main():
+    game = Game()
+    session = 0
+    frame_count = 0
+    controller = make_input(args.input)
+    recorder = None
+    if args.telemetry:
+        from telemetry import TelemetryRecorder
+        recorder = TelemetryRecorder(args.telemetry)
+    memory = MemoryProfiler([Game, Player, Obstacle, Collectible, Enemy, Projectile],
+                            interval=args.memprofile_interval)
+    if args.memprofile:
+        memory.enable(session)
+    server = MetricsServer(metrics, args.metrics_port) if args.metrics_port else None
+    sessions_counter.inc()
+    
+    running = True
+    while running:
+        dt = clock.tick(60) / 1000.0
+        frame_start = time.perf_counter()
+        read_time = 0.0
+        player = game.player
+        
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            if event.type == pygame.VIDEORESIZE:
+                render_target.resize(pygame.display.get_surface())
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    if game.game_over:
+                        game = Game()
+                        session += 1
+                        player = game.player
+                        memory.session_start(session)
+                        sessions_counter.inc()
+                    else:
+                        player.jump()
+                if event.key == pygame.K_DOWN:
+                    player.duck()
+                if event.key == pygame.K_f:  # F key to shoot (backup)
+                    game.shoot()
+                if event.key == pygame.K_m:  # M toggles memory profiling
+                    memory.toggle(session)
+            if event.type == pygame.KEYUP:
+                if event.key == pygame.K_DOWN:
+                    player.stand()
+        
+        controls = None
+        if not game.game_over:
+            # Player input (hand gestures or autopilot)
+            controls = controller.poll(game)
+            # Waiting on the camera is not render load; keep it out of the frame
+            # budget, but inference and the preview are work the tiers can cut
+            read_time = controller.read_time
+            if controls:
+                game.apply_controls(controls)
+            game.update(dt)
+            if game.game_over:
+                memory.game_over(session)
+                game_overs_counter.labels(game.death_cause).inc()
+        memory.tick(session)
+        particles.update(dt, 0 if game.game_over else game.gesture_speed)
+        
+        draw(game, controller)
+        pygame.display.flip()
+        
+        # Recorded after the flip so the row's work time belongs to its own frame
+        work_ms = (time.perf_counter() - frame_start - read_time) * 1000
+        frame_count += 1
+        update_metrics(game, work_ms)
+        if recorder:
+            record_frame(recorder, session, frame_count, game, controller, controls, dt, work_ms)
+        if args.quality == "auto":
+            governor.update(work_ms)
     
-    pygame.display.flip()
+    controller.close()
+    if recorder:
+        recorder.close()
+    memory.disable()
+    audio.close()
+    if server:
+        server.close()
+    pygame.quit()
 
-cap.release()
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""
+Gesture Threshold Sweep
+Evaluates a grid of gesture rule thresholds and detection confidences
+against a labelled corpus of recorded frames, using a process pool
+
+Corpus layout: a labels.csv with columns  frame,left,right
+  frame  image path, video path with '#<frame index>', or a .npy file of
+         already extracted landmarks with shape (2, 21, 3) [left, right]
+  left   OPEN / FIST / NONE  (blank = unlabelled)
+  right  OPEN / FIST / GUN / NONE  (blank = unlabelled)
+Paths are relative to the CSV. MediaPipe output is cached per chunk and
+confidence, so each confidence setting only runs inference once.
+
+Usage:
+  python gesture_sweep.py corpus/labels.csv --confidence 0.5,0.6,0.7 \\
+      --fist-min-folded 2,3,4 --fold-margin 0,0.01,0.02 --gun-min-folded 1,2
+"""
+
+import argparse
+import csv
+import hashlib
+import itertools
+import os
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from gestures import GESTURE_NAMES, GESTURE_PARAMS, NONE, classify
+
+CHUNK_SIZE = 256  # frames per inference task / cache file
+CACHE_VERSION = 2  # Bump when inference output changes so stale chunk caches are ignored
+HAND_SLOTS = {"Left": 0, "Right": 1}
+
+
+# -------------------- Corpus --------------------
+def load_corpus(labels_path):
+    """Read labels.csv into frame references and (N, 2) label codes (-1 = unlabelled)"""
+    base = os.path.dirname(os.path.abspath(labels_path))
+    frames = []
+    labels = []
+    with open(labels_path, newline="") as f:
+        for row in csv.DictReader(f):
+            ref = row["frame"].strip()
+            path, _, index = ref.partition("#")
+            frames.append((os.path.join(base, path), int(index) if index else None))
+            labels.append([
+                GESTURE_NAMES.index(row[hand].strip().upper()) if row.get(hand, "").strip() else -1
+                for hand in ("left", "right")
+            ])
+    return frames, np.array(labels, dtype=np.int8).reshape(-1, 2)
+
+
+def frame_kind(frame):
+    path, index = frame
+    if index is not None:
+        return "video"
+    return "landmarks" if path.endswith(".npy") else "image"
+
+
+def make_chunks(frames):
+    """Group frames into inference tasks; consecutive video frames share one sequential read"""
+    chunks = []
+    current = []
+    for i, frame in enumerate(frames):
+        if current:
+            prev = frames[current[-1]]
+            kind = frame_kind(frame)
+            split = len(current) >= CHUNK_SIZE or kind != frame_kind(prev)
+            if kind == "video" and (frame[0] != prev[0] or frame[1] != prev[1] + 1):
+                split = True
+            if split:
+                chunks.append(current)
+                current = []
+        current.append(i)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_key(frames, chunk, confidence, flip):
+    """Cache key from file identity (path, size, mtime), frame range and inference settings"""
+    h = hashlib.sha1(f"{CACHE_VERSION}|{confidence}|{flip}".encode())
+    for i in chunk:
+        path, index = frames[i]
+        st = os.stat(path)
+        h.update(f"{path}|{index}|{st.st_size}|{st.st_mtime_ns}".encode())
+    return h.hexdigest()
+
+
+# -------------------- Inference (worker side) --------------------
+_hands = {}
+
+
+def _new_hands(confidence, static):
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(static_image_mode=static, max_num_hands=2,
+                                    min_detection_confidence=confidence)
+
+
+def _get_hands(confidence, static):
+    """Hands instance for a chunk; only stateless image-mode instances are reused.
+
+    Video mode tracks hands from frame to frame, so a reused instance would
+    carry the previous chunk's state into the next one and make the results
+    depend on how chunks were scheduled across workers.
+    """
+    if not static:
+        return _new_hands(confidence, static)
+    if confidence not in _hands:
+        _hands[confidence] = _new_hands(confidence, static)
+    return _hands[confidence]
+
+
+def _read_chunk(frames):
+    import cv2
+    path, first = frames[0]
+    if first is None:
+        for path, _ in frames:
+            yield cv2.imread(path)
+        return
+    cap = cv2.VideoCapture(path)
+    cap.set(cv2.CAP_PROP_POS_FRAMES, first)
+    for _ in frames:
+        ret, frame = cap.read()
+        yield frame if ret else None
+    cap.release()
+
+
+def infer_chunk(task):
+    """Run MediaPipe over one chunk, returning (cache_path, frame count, seconds)"""
+    frames, confidence, flip, cache_path = task
+    if os.path.exists(cache_path):
+        return cache_path, 0, 0.0
+
+    import cv2
+    start = time.perf_counter()
+    if frame_kind(frames[0]) == "landmarks":
+        out = np.stack([np.load(path).astype(np.float32) for path, _ in frames])
+        np.save(cache_path + ".tmp.npy", out)
+        os.replace(cache_path + ".tmp.npy", cache_path)
+        return cache_path, 0, 0.0
+
+    out = np.full((len(frames), 2, 21, 3), np.nan, dtype=np.float32)
+    static = frame_kind(frames[0]) == "image"
+    hands = _get_hands(confidence, static)
+    for i, frame in enumerate(_read_chunk(frames)):
+        if frame is None:
+            continue
+        if flip:
+            frame = cv2.flip(frame, 1)
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        if not results.multi_hand_landmarks:
+            continue
+        for hand_landmarks, hand_info in zip(results.multi_hand_landmarks, results.multi_handedness):
+            slot = HAND_SLOTS[hand_info.classification[0].label]
+            out[i, slot] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
+    if not static:
+        hands.close()
+    np.save(cache_path + ".tmp.npy", out)
+    os.replace(cache_path + ".tmp.npy", cache_path)
+    return cache_path, len(frames), time.perf_counter() - start
+
+
+def run_inference(pool, frames, confidences, cache_dir, flip):
+    """Landmark stack per confidence, saved as one .npy for memory-mapping by workers.
+
+    Returns ({confidence: stack path}, {confidence: inference frames/s or None if cached})
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    chunks = make_chunks(frames)
+    stacks = {}
+    rates = {}
+    for confidence in confidences:
+        tasks = []
+        for chunk in chunks:
+            key = chunk_key(frames, chunk, confidence, flip)
+            tasks.append(([frames[i] for i in chunk], confidence, flip,
+                          os.path.join(cache_dir, f"{key}.npy")))
+        start = time.perf_counter()
+        inferred = 0
+        for _, count, _ in pool.imap_unordered(infer_chunk, tasks):
+            inferred += count
+        elapsed = time.perf_counter() - start
+
+        stack_path = os.path.join(cache_dir, f"stack_{confidence}.npy")
+        np.save(stack_path, np.concatenate([np.load(t[3]) for t in tasks]))
+        stacks[confidence] = stack_path
+        rates[confidence] = inferred / elapsed if inferred else None
+        rate = f"{rates[confidence]:.1f} frames/s" if inferred else "cached"
+        print(f"✓ Confidence {confidence}: {len(frames)} frames ({rate})")
+    return stacks, rates
+
+
+# -------------------- Rule Evaluation (worker side) --------------------
+_stacks = {}
+_labels = None
+
+
+def _init_eval(stacks, labels_path):
+    global _stacks, _labels
+    _stacks = {c: np.load(p, mmap_mode="r") for c, p in stacks.items()}
+    _labels = np.load(labels_path)
+
+
+def evaluate(config):
+    """Score one configuration against the labelled corpus"""
+    params = dict(GESTURE_PARAMS, **config)
+    lm = np.asarray(_stacks[params["detection_confidence"]])
+    start = time.perf_counter()
+    predicted = np.stack([classify(lm[:, 0], right_hand=False, params=params),
+                          classify(lm[:, 1], right_hand=True, params=params)], axis=1)
+    seconds = time.perf_counter() - start
+
+    labelled = _labels >= 0
+    total = max(1, int(labelled.sum()))
+    correct = (predicted == _labels) & labelled
+    # A false trigger is an action the game would take that the label disagrees with
+    false_trigger = (predicted != _labels) & (predicted != NONE) & labelled
+    return dict(config,
+                accuracy=correct.sum() / total,
+                false_trigger_rate=false_trigger.sum() / total,
+                frames_per_s=len(lm) / seconds if seconds else float("inf"))
+
+
+def sweep_grid(args):
+    grid = {
+        "detection_confidence": args.confidence,
+        "fist_min_folded": args.fist_min_folded,
+        "fold_margin": args.fold_margin,
+        "gun_min_folded": args.gun_min_folded,
+    }
+    keys = list(grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*grid.values())]
+
+
+def parse_list(cast):
+    return lambda text: [cast(v) for v in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep gesture thresholds over a labelled corpus")
+    parser.add_argument("labels", help="labels.csv describing the corpus")
+    parser.add_argument("--confidence", type=parse_list(float),
+                        default=[GESTURE_PARAMS["detection_confidence"]])
+    parser.add_argument("--fist-min-folded", type=parse_list(int), default=[2, 3, 4])
+    parser.add_argument("--fold-margin", type=parse_list(float), default=[0.0, 0.01, 0.02])
+    parser.add_argument("--gun-min-folded", type=parse_list(int), default=[1, 2, 3])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--cache-dir", default=".sweep_cache")
+    parser.add_argument("--no-flip", action="store_true", help="Frames are already mirrored like the game view")
+    parser.add_argument("--out", default="sweep_results.csv")
+    args = parser.parse_args()
+
+    frames, labels = load_corpus(args.labels)
+    print(f"Loaded {len(frames)} frames, {int((labels >= 0).sum())} labelled hands")
+
+    configs = sweep_grid(args)
+    with Pool(args.workers) as pool:
+        stacks, rates = run_inference(pool, frames, args.confidence, args.cache_dir, not args.no_flip)
+
+    labels_path = os.path.join(args.cache_dir, "labels.npy")
+    np.save(labels_path, labels)
+    start = time.perf_counter()
+    with Pool(args.workers, initializer=_init_eval, initargs=(stacks, labels_path)) as pool:
+        results = list(pool.imap_unordered(evaluate, configs, chunksize=max(1, len(configs) // (args.workers * 4))))
+    elapsed = time.perf_counter() - start
+    for r in results:
+        r["inference_frames_per_s"] = rates[r["detection_confidence"]]
+    results.sort(key=lambda r: (-r["accuracy"], r["false_trigger_rate"]))
+
+    with open(args.out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+    print(f"\n{len(configs)} configurations in {elapsed:.2f}s "
+          f"({len(configs) * len(frames) / elapsed:.0f} frame-evaluations/s)")
+    print(f"{'conf':>5} {'fist':>4} {'margin':>6} {'gun':>3} {'accuracy':>8} {'false-trig':>10}")
+    for r in results[:10]:
+        print(f"{r['detection_confidence']:>5} {r['fist_min_folded']:>4} {r['fold_margin']:>6} "
+              f"{r['gun_min_folded']:>3} {r['accuracy']:>8.3f} {r['false_trigger_rate']:>10.3f}")
+    print(f"\n✓ Full results saved to: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Hand gesture rules shared by the game, the hand test and the sweep tool
+Rules work on landmark arrays of shape (..., 21, 3) so they can be
+evaluated for a single hand or vectorized over a whole recorded corpus
+"""
+
+import numpy as np
+
+TIPS = [8, 12, 16, 20]   # index, middle, ring, pinky
+PIPS = [6, 10, 14, 18]
+
+# Classification codes used by the sweep tool
+NONE, OPEN, FIST, GUN = 0, 1, 2, 3
+GESTURE_NAMES = ["NONE", "OPEN", "FIST", "GUN"]
+
+GESTURE_PARAMS = {
+    "detection_confidence": 0.7,
+    "fist_min_folded": 3,   # of 4 fingers folded
+    "fold_margin": 0.0,     # normalized y a tip must sit below its PIP to count as folded
+    "gun_min_folded": 1,    # of middle/ring/pinky folded while the index is extended
+}
+
+
+def landmark_array(hand_landmarks):
+    """Convert MediaPipe hand landmarks to a (21, 3) float array"""
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark], dtype=np.float32)
+
+
+def folded_fingers(lm, margin=0.0):
+    """Boolean (..., 4) array of index/middle/ring/pinky folded (tip below PIP)"""
+    return lm[..., TIPS, 1] > lm[..., PIPS, 1] + margin
+
+
+def fist_mask(lm, params=GESTURE_PARAMS):
+    return folded_fingers(lm, params["fold_margin"]).sum(axis=-1) >= params["fist_min_folded"]
+
+
+def gun_mask(lm, params=GESTURE_PARAMS):
+    # Gun gesture: index extended, others folded
+    folded = folded_fingers(lm, params["fold_margin"])
+    index_extended = lm[..., 8, 1] < lm[..., 6, 1] - params["fold_margin"]
+    return index_extended & (folded[..., 1:].sum(axis=-1) >= params["gun_min_folded"])
+
+
+def is_fist(hand_landmarks, params=GESTURE_PARAMS):
+    return bool(fist_mask(landmark_array(hand_landmarks), params))
+
+
+def is_gun_gesture(hand_landmarks, params=GESTURE_PARAMS):
+    return bool(gun_mask(landmark_array(hand_landmarks), params))
+
+
+def classify(lm, right_hand, params=GESTURE_PARAMS):
+    """Gesture codes for landmark arrays; NaN landmarks (no hand) give NONE.
+
+    The right hand can be GUN, FIST or OPEN (checked in that order, as in the
+    game loop); the left hand only FIST or OPEN.
+    """
+    present = ~np.isnan(lm[..., 0, 0])
+    codes = np.where(fist_mask(lm, params), FIST, OPEN)
+    if right_hand:
+        codes = np.where(gun_mask(lm, params), GUN, codes)
+    return np.where(present, codes, NONE)
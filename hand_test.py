@@ -1,30 +1,39 @@
+import argparse
+import time
 import cv2
 import mediapipe as mp
+from gestures import GESTURE_PARAMS, is_fist
+from frame_sources import open_source, parse_capture
+
+parser = argparse.ArgumentParser(description="Hand gesture test view")
+parser.add_argument("--source", default="0", help="Webcam index, video file or image directory")
+parser.add_argument("--pacing", default="realtime", choices=["realtime", "fast"],
+                    help="Play file sources at their frame rate or as fast as they decode")
+parser.add_argument("--headless", action="store_true", help="No preview window; just measure throughput")
+parser.add_argument("--capture", default="320x240@30", metavar="WxH@FPS",
+                    help="Smallest webcam mode to negotiate, or 'driver' for the driver defaults")
+parser.add_argument("--reprobe", action="store_true", help="Probe the webcam's modes again instead of using the cache")
+args = parser.parse_args()
 
 mp_hands = mp.solutions.hands
 mp_draw = mp.solutions.drawing_utils
 
 hands = mp_hands.Hands(
     max_num_hands=2,
-    min_detection_confidence=0.7,
+    min_detection_confidence=GESTURE_PARAMS["detection_confidence"],
     min_tracking_confidence=0.7
 )
 
-def is_fist(hand_landmarks):
-    tips = [8, 12, 16, 20]
-    pips = [6, 10, 14, 18]
-    folded = 0
-
-    for tip, pip in zip(tips, pips):
-        if hand_landmarks.landmark[tip].y > hand_landmarks.landmark[pip].y:
-            folded += 1
-
-    return folded >= 3
-
-cap = cv2.VideoCapture(0)
+cap = open_source(args.source, realtime=args.pacing == "realtime",
+                  capture=parse_capture(args.capture), reprobe=args.reprobe)
+frames = 0
+start = time.perf_counter()
 
 while True:
     ret, frame = cap.read()
+    if not ret:
+        break
+    frames += 1
     frame = cv2.flip(frame, 1)
     rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
     results = hands.process(rgb)
@@ -43,9 +52,14 @@ while True:
                 cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2
             )
 
+    if args.headless:
+        continue
     cv2.imshow("Hand Test", frame)
     if cv2.waitKey(1) & 0xFF == ord('q'):
         break
 
+elapsed = time.perf_counter() - start
+print(f"Processed {frames} frames in {elapsed:.1f}s ({frames / max(elapsed, 1e-9):.1f} FPS)")
 cap.release()
 cv2.destroyAllWindows()
+
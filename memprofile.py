@@ -0,0 +1,155 @@
+"""
+Memory instrumentation
+tracemalloc snapshots at session start, at each game over and on a timer,
+diffed by source line, plus live counts of game objects and pygame Surfaces.
+Session-start samples are compared across restarts to flag growth. Nothing
+is traced while the profiler is switched off.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections import Counter
+
+import pygame
+
+SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+
+def count_surfaces():
+    """Live Surfaces by size.
+
+    Surfaces are not tracked by the garbage collector, and neither are
+    containers that only hold untracked objects (a dict of Surfaces, a
+    tuple used as a cache key), so everything reachable from the tracked
+    objects is walked, each object once.
+    """
+    sizes = Counter()
+    roots = gc.get_objects()
+    seen = {id(obj) for obj in roots}
+    pending = list(roots)
+    while pending:
+        for ref in gc.get_referents(pending.pop()):
+            if id(ref) in seen:
+                continue
+            seen.add(id(ref))
+            if isinstance(ref, pygame.Surface):
+                sizes[ref.get_size()] += 1
+            else:
+                pending.append(ref)
+    return sizes
+
+
+class MemoryProfiler:
+    """Runtime-switchable tracemalloc profiler for long-running sessions.
+
+    `tracked_types` are the classes whose live instances are counted. A
+    fresh session should always start from the same state, so every
+    session-start sample after the first is checked against the first one
+    and any growth is reported as a likely leak.
+    """
+
+    def __init__(self, tracked_types=(), interval=60.0, top=10, frames=1):
+        self.tracked_types = tuple(tracked_types)
+        self.interval = interval
+        self.top = top
+        self.frames = frames
+        self.enabled = False
+        self.samples = []  # One per session start while enabled
+        self._snapshot = None
+        self._next_time = 0.0
+
+    def enable(self, session=0):
+        if self.enabled:
+            return
+        tracemalloc.start(self.frames)
+        self.enabled = True
+        self._snapshot = None
+        self.samples = []  # Traced sizes restart from zero with tracemalloc
+        print("Memory profiling on")
+        self.session_start(session)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.report()
+        tracemalloc.stop()
+        self.enabled = False
+        self._snapshot = None
+        print("Memory profiling off")
+
+    def toggle(self, session=0):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(session)
+
+    def tick(self, session):
+        """Call once per frame; takes the periodic snapshot when it is due"""
+        if self.enabled and time.perf_counter() >= self._next_time:
+            self.capture(f"session {session} periodic")
+
+    def session_start(self, session):
+        if self.enabled:
+            self.samples.append((session, self.capture(f"session {session} start")))
+            self.check_growth()
+
+    def game_over(self, session):
+        if self.enabled:
+            self.capture(f"session {session} game over")
+
+    def capture(self, label):
+        """Snapshot, print the top changes since the previous one and return a sample"""
+        gc.collect()  # Only count what is really still reachable
+        snapshot = tracemalloc.take_snapshot().filter_traces(SNAPSHOT_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+        objects = Counter(type(obj).__name__ for obj in gc.get_objects()
+                          if isinstance(obj, self.tracked_types))
+        surfaces = count_surfaces()
+
+        print(f"\n[memory] {label}: traced {current / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB)")
+        if self._snapshot is None:
+            for stat in snapshot.statistics("lineno")[:self.top]:
+                print(f"  {stat}")
+        else:
+            for stat in snapshot.compare_to(self._snapshot, "lineno")[:self.top]:
+                if stat.size_diff:
+                    print(f"  {stat}")
+        print("  objects: " + (", ".join(f"{name} {n}" for name, n in sorted(objects.items())) or "none"))
+        print(f"  surfaces: {sum(surfaces.values())} ("
+              + ", ".join(f"{w}x{h} {n}" for (w, h), n in surfaces.most_common(5)) + ")")
+
+        self._snapshot = snapshot
+        self._next_time = time.perf_counter() + self.interval
+        return {"traced": current, "objects": objects, "surfaces": sum(surfaces.values())}
+
+    def check_growth(self):
+        """Compare the latest session start with the first one"""
+        if len(self.samples) < 2:
+            return
+        (first_session, first), (session, latest) = self.samples[0], self.samples[-1]
+        growth = []
+        for name, count in latest["objects"].items():
+            if count > first["objects"][name]:
+                growth.append(f"{name} {first['objects'][name]} -> {count}")
+        if latest["surfaces"] > first["surfaces"]:
+            growth.append(f"Surfaces {first['surfaces']} -> {latest['surfaces']}")
+        traced = [sample["traced"] for _, sample in self.samples]
+        if len(traced) >= 3 and all(b > a for a, b in zip(traced, traced[1:])):
+            growth.append(f"traced memory up {(traced[-1] - traced[0]) / 1024:.0f} KiB "
+                          f"over {len(traced) - 1} restarts")
+        if growth:
+            print(f"⚠ Memory growth since session {first_session} start: " + "; ".join(growth))
+
+    def report(self):
+        if not self.samples:
+            return
+        print("\n[memory] session starts:")
+        for session, sample in self.samples:
+            objects = sum(sample["objects"].values())
+            print(f"  session {session}: traced {sample['traced'] / 1024:.0f} KiB, "
+                  f"{objects} game objects, {sample['surfaces']} surfaces")
@@ -0,0 +1,79 @@
+"""
+Parallax background
+Each layer is composed once from the Kenney background tilemap into a wide
+strip that wraps seamlessly, then drawn every frame with at most two
+area-clipped blits at its own scroll factor
+"""
+
+import math
+
+import pygame
+
+TILE_SIZE = 24  # tilemap-backgrounds_packed.png is 8 x 3 tiles of 24x24
+
+# Back to front. `rows` are tilemap rows stacked from `top` (logical units);
+# the last row repeats down to the ground line. `columns` is the repeating
+# horizontal pattern, `scale` the tile magnification (a multiple of every
+# render scale, 1 and 3, so tiles stay whole pixels) and `factor` the scroll
+# speed relative to the ground. Keyed layers make the theme's sky colour
+# transparent so the layers behind show through.
+BACKGROUND_LAYERS = [
+    {"name": "sky", "rows": [0], "columns": [0], "top": 0, "scale": 3, "factor": 0.0, "keyed": False},
+    {"name": "far_hills", "rows": [1, 2], "columns": [0, 1, 2, 3], "top": 100, "scale": 3,
+     "factor": 0.15, "keyed": True},
+    {"name": "near_hills", "rows": [1, 2], "columns": [2, 3, 0, 1], "top": 160, "scale": 6,
+     "factor": 0.4, "keyed": True},
+]
+
+
+class ParallaxLayer:
+    def __init__(self, sheet, spec, render_scale, width, ground_y):
+        self.name = spec["name"]
+        self.factor = spec["factor"]
+        self.render_scale = render_scale
+        self.y = int(spec["top"] // render_scale)
+        if spec["scale"] % render_scale:
+            # Rounding would draw the layer at another layer's size and lose the depth cue
+            raise ValueError(f"{self.name}: scale {spec['scale']} is not a multiple of render scale {render_scale}")
+        tile = TILE_SIZE * spec["scale"] // render_scale
+        height = max(1, int(ground_y // render_scale) - self.y)
+        period = tile * len(spec["columns"])
+        # Whole pattern periods at least one world-width wide, so any offset
+        # needs at most the strip tail plus its head to cover the surface
+        self.strip_w = period * math.ceil(width / render_scale / period)
+
+        tiles = {}
+        def scaled(row, col):
+            if (row, col) not in tiles:
+                src = sheet.subsurface((col * TILE_SIZE, row * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+                tiles[row, col] = pygame.transform.scale(src, (tile, tile))
+            return tiles[row, col]
+
+        strip = pygame.Surface((self.strip_w, height)).convert()
+        rows = list(spec["rows"])
+        rows += [rows[-1]] * max(0, math.ceil(height / tile) - len(rows))
+        for i, row in enumerate(rows):
+            for x in range(0, self.strip_w, tile):
+                strip.blit(scaled(row, spec["columns"][x // tile % len(spec["columns"])]), (x, i * tile))
+        if spec["keyed"]:
+            # Top-left pixel of the theme's sky tile
+            strip.set_colorkey(sheet.get_at((spec["columns"][0] * TILE_SIZE, 0))[:3], pygame.RLEACCEL)
+        self.strip = strip
+        self.height = height
+
+    def draw(self, surface, distance):
+        offset = int(distance * self.factor // self.render_scale) % self.strip_w
+        head = self.strip_w - offset
+        surface.blit(self.strip, (0, self.y), (offset, 0, head, self.height))
+        if head < surface.get_width():
+            surface.blit(self.strip, (head, self.y), (0, 0, surface.get_width() - head, self.height))
+
+
+class ParallaxBackground:
+    def __init__(self, sheet, render_scale, width, ground_y, layers=BACKGROUND_LAYERS):
+        self.layers = [ParallaxLayer(sheet, spec, render_scale, width, ground_y) for spec in layers]
+
+    def draw(self, surface, distance, max_layers=None):
+        """Draw back to front; `distance` is the total logical ground scroll"""
+        for layer in self.layers[:max_layers]:
+            layer.draw(surface, distance)
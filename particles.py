@@ -0,0 +1,95 @@
+"""
+Vectorized particle system
+All particles live in fixed-capacity NumPy arrays, are updated in one
+vectorized step and drawn with a single batched blits() call using small
+pre-tinted sprites cached per colour and fade level
+"""
+
+import numpy as np
+import pygame
+
+FADE_LEVELS = 8
+
+# name: (colour, speed, life seconds, gravity) in logical units per second
+EFFECTS = {
+    "hit": ((255, 255, 255), 180, 0.25, 300),
+    "enemy_death": ((255, 90, 60), 260, 0.6, 500),
+    "coin": ((255, 215, 0), 150, 0.5, -60),
+    "player_hit": ((255, 50, 50), 200, 0.4, 400),
+    "game_over": ((255, 120, 120), 320, 1.2, 350),
+}
+
+
+class ParticleSystem:
+    def __init__(self, capacity=4096, render_scale=1, size=6):
+        self.capacity = capacity
+        self.render_scale = render_scale
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.gravity = np.zeros(capacity, dtype=np.float32)
+        self.sprite = np.zeros(capacity, dtype=np.int32)  # effect index * FADE_LEVELS
+        self.head = 0  # Ring write position: new bursts overwrite the oldest slots
+        self.rng = np.random.default_rng()
+
+        self.effect_index = {name: i for i, name in enumerate(EFFECTS)}
+        side = self.side = max(1, size // render_scale)
+        self.sprites = []
+        for colour, _, _, _ in EFFECTS.values():
+            for level in range(FADE_LEVELS):
+                sprite = pygame.Surface((side, side))
+                sprite.fill(colour)
+                sprite.set_alpha(int(255 * (level + 1) / FADE_LEVELS))
+                self.sprites.append(sprite)
+
+    def burst(self, x, y, effect, count=16):
+        """Emit `count` particles radiating from (x, y) in logical coordinates"""
+        count = min(count, self.capacity)
+        if count <= 0:
+            return
+        _, speed, life, gravity = EFFECTS[effect]
+        idx = (self.head + np.arange(count)) % self.capacity
+        self.head = (self.head + count) % self.capacity
+
+        angle = self.rng.uniform(0, 2 * np.pi, count)
+        magnitude = speed * self.rng.uniform(0.3, 1.0, count)
+        self.pos[idx] = (x, y)
+        self.vel[idx, 0] = np.cos(angle) * magnitude
+        self.vel[idx, 1] = np.sin(angle) * magnitude
+        lifetimes = life * self.rng.uniform(0.6, 1.0, count)
+        self.life[idx] = lifetimes
+        self.max_life[idx] = lifetimes
+        self.gravity[idx] = gravity
+        self.sprite[idx] = self.effect_index[effect] * FADE_LEVELS
+
+    def update(self, dt, scroll=0):
+        """Advance every particle; `scroll` moves them with the world (logical px this frame)"""
+        self.vel[:, 1] += self.gravity * dt
+        self.pos += self.vel * dt
+        self.pos[:, 0] -= scroll
+        self.life -= dt
+
+    def draw(self, surface):
+        alive = np.flatnonzero(self.life > 0)
+        if not len(alive):
+            return
+        screen_pos = (self.pos[alive] // self.render_scale).astype(np.int32)
+        # Cull particles that left the surface before building the blit list
+        width, height = surface.get_size()
+        visible = ((screen_pos[:, 0] >= -self.side) & (screen_pos[:, 0] < width)
+                   & (screen_pos[:, 1] >= -self.side) & (screen_pos[:, 1] < height))
+        alive = alive[visible]
+        screen_pos = screen_pos[visible]
+        level = (self.life[alive] / self.max_life[alive] * FADE_LEVELS).astype(np.int32)
+        sprite_idx = self.sprite[alive] + np.minimum(level, FADE_LEVELS - 1)
+        sprites = self.sprites
+        surface.blits([(sprites[i], p) for i, p in zip(sprite_idx.tolist(), screen_pos.tolist())],
+                      doreturn=False)
+
+    def clear(self):
+        self.life[:] = 0
+
+    @property
+    def live_count(self):
+        return int(np.count_nonzero(self.life > 0))
@@ -0,0 +1,68 @@
+"""
+Adaptive quality governor
+Watches a moving average of frame work time and steps through quality
+tiers, shedding visual cost under pressure and restoring it with headroom
+"""
+
+# Tier 0 is full quality; each following tier sheds more visual cost
+QUALITY_TIERS = [
+    {"name": "high", "glow": True, "coin_rotation": True, "shadows": True,
+     "preview_every": 1, "preview_scale": 1.0, "background_layers": 3, "particles": 1.0},
+    {"name": "medium", "glow": False, "coin_rotation": True, "shadows": False,
+     "preview_every": 1, "preview_scale": 1.0, "background_layers": 3, "particles": 1.0},
+    {"name": "low", "glow": False, "coin_rotation": False, "shadows": False,
+     "preview_every": 2, "preview_scale": 1.0, "background_layers": 2, "particles": 0.5},
+    {"name": "minimal", "glow": False, "coin_rotation": False, "shadows": False,
+     "preview_every": 4, "preview_scale": 0.5, "background_layers": 1, "particles": 0.25},
+]
+
+
+class QualityGovernor:
+    """Step quality tiers from an exponential moving average of frame time.
+
+    Degrades when the average exceeds `budget_ms * degrade_ratio` and only
+    restores once it falls below `budget_ms * restore_ratio`. Every change is
+    followed by a cooldown so the average can settle before the next step.
+    """
+
+    def __init__(self, budget_ms=1000 / 60, tiers=QUALITY_TIERS, smoothing=0.05,
+                 degrade_ratio=1.0, restore_ratio=0.6, cooldown_frames=90):
+        self.budget_ms = budget_ms
+        self.tiers = tiers
+        self.smoothing = smoothing
+        self.degrade_ratio = degrade_ratio
+        self.restore_ratio = restore_ratio
+        self.cooldown_frames = cooldown_frames
+        self.tier = 0
+        self.avg_ms = 0.0
+        self.cooldown = cooldown_frames
+        self.changes = 0
+
+    @property
+    def settings(self):
+        return self.tiers[self.tier]
+
+    def update(self, frame_ms):
+        """Feed the work time of the last frame; returns True if the tier changed"""
+        if self.avg_ms == 0.0:
+            self.avg_ms = frame_ms
+        else:
+            self.avg_ms += (frame_ms - self.avg_ms) * self.smoothing
+
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return False
+
+        if self.avg_ms > self.budget_ms * self.degrade_ratio and self.tier < len(self.tiers) - 1:
+            self.set_tier(self.tier + 1)
+            return True
+        if self.avg_ms < self.budget_ms * self.restore_ratio and self.tier > 0:
+            self.set_tier(self.tier - 1)
+            return True
+        return False
+
+    def set_tier(self, tier):
+        self.tier = max(0, min(tier, len(self.tiers) - 1))
+        self.cooldown = self.cooldown_frames
+        self.changes += 1
+        print(f"Quality tier -> {self.settings['name']} (avg frame {self.avg_ms:.1f} ms)")
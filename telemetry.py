@@ -0,0 +1,152 @@
+"""
+Per-frame gameplay telemetry
+Rows are appended into preallocated NumPy column buffers; full chunks are
+written to compressed .npz files by a background thread so the game loop
+never waits on disk. If the writer falls behind, chunks are dropped and
+counted instead of blocking.
+"""
+
+import glob
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+COLUMNS = {
+    "session": np.int32,
+    "frame": np.int32,
+    "time": np.float64,         # seconds since the recorder started
+    "dt_ms": np.float32,        # interval since the previous frame, as stepped by the simulation
+    "frame_ms": np.float32,     # work time of the frame (excluding camera waits and the frame-cap sleep)
+    "player_y": np.float32,
+    "player_vy": np.float32,
+    "player_health": np.int8,
+    "jumping": np.bool_,
+    "ducking": np.bool_,
+    "gesture_speed": np.int8,
+    "left_gesture": np.int8,    # gestures.NONE / OPEN / FIST / GUN
+    "right_gesture": np.int8,
+    "jump_cmd": np.bool_,
+    "duck_cmd": np.bool_,
+    "shoot_cmd": np.bool_,
+    "obstacles": np.int16,
+    "collectibles": np.int16,
+    "enemies": np.int16,
+    "projectiles": np.int16,
+    "collisions": np.int32,     # cumulative per session
+    "score": np.int32,
+    "quality_tier": np.int8,
+    "game_over": np.bool_,
+}
+
+
+class TelemetryRecorder:
+    """Columnar per-frame recorder with a bounded background flush queue"""
+
+    def __init__(self, out_dir, chunk_rows=4096, max_pending=4):
+        self.run_dir = os.path.join(out_dir, time.strftime("run_%Y%m%d_%H%M%S") + f"_{os.getpid()}")
+        os.makedirs(self.run_dir, exist_ok=True)
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.dropped_rows = 0
+        self.chunks_written = 0
+        self._start = time.perf_counter()
+        # Buffer sets cycle between the game loop and the writer; none are allocated per chunk
+        self._spare = queue.Queue()
+        for _ in range(max_pending + 1):
+            self._spare.put(self._new_buffers())
+        self._pending = queue.Queue(maxsize=max_pending)
+        self._cols = self._spare.get()
+        self._n = 0
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def _new_buffers(self):
+        return {name: np.zeros(self.chunk_rows, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+    def record(self, **values):
+        """Append one row; columns not given keep the value 0"""
+        n = self._n
+        cols = self._cols
+        cols["time"][n] = time.perf_counter() - self._start
+        for name, value in values.items():
+            cols[name][n] = value
+        self._n = n + 1
+        self.rows += 1
+        if self._n == self.chunk_rows:
+            self._submit()
+
+    def _submit(self):
+        try:
+            spare = self._spare.get_nowait()
+        except queue.Empty:
+            # Writer is behind and every buffer set is in flight: drop this chunk
+            self._drop(self._cols, self._n)
+            self._n = 0
+            return
+        try:
+            self._pending.put_nowait((self._cols, self._n))
+        except queue.Full:
+            self._drop(self._cols, self._n)
+            self._spare.put(self._cols)
+        self._cols = spare
+        self._n = 0
+
+    def _drop(self, cols, n):
+        # Reused buffers must start zeroed, as record() promises for unset columns
+        self.dropped_rows += n
+        for col in cols.values():
+            col[:n] = 0
+
+    def _write_loop(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            cols, n = item
+            path = os.path.join(self.run_dir, f"chunk_{self.chunks_written:06d}.npz")
+            np.savez_compressed(path, **{name: col[:n] for name, col in cols.items()})
+            self.chunks_written += 1
+            for col in cols.values():
+                col[:n] = 0
+            self._spare.put(cols)
+
+    def close(self):
+        """Flush the partial chunk and wait for the writer to finish"""
+        if self._n:
+            self._pending.put((self._cols, self._n))
+            self._n = 0
+        self._pending.put(None)
+        self._thread.join()
+        print(f"✓ Telemetry: {self.rows} rows in {self.chunks_written} chunks "
+              f"({self.dropped_rows} dropped) -> {self.run_dir}")
+
+
+# -------------------- Analysis --------------------
+def load_run(run_dir):
+    """Memory-map every column of a recorded run.
+
+    Compressed chunks are consolidated once into per-column .npy files under
+    `run_dir/columns`, which are then opened with mmap_mode="r".
+    """
+    chunks = sorted(glob.glob(os.path.join(run_dir, "chunk_*.npz")))
+    col_dir = os.path.join(run_dir, "columns")
+    marker = os.path.join(col_dir, f".{len(chunks)}_chunks")
+    if not os.path.exists(marker):
+        os.makedirs(col_dir, exist_ok=True)
+        for stale in glob.glob(os.path.join(col_dir, ".*_chunks")):
+            os.remove(stale)
+        loaded = [np.load(path) for path in chunks]
+        for name, dtype in COLUMNS.items():
+            parts = [data[name] for data in loaded if name in data.files]
+            column = np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+            np.save(os.path.join(col_dir, f"{name}.npy"), column)
+        open(marker, "w").close()
+    return {name: np.load(os.path.join(col_dir, f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
+
+
+def load_runs(root):
+    """Memory-mapped columns for every run under a telemetry directory"""
+    return {os.path.basename(d): load_run(d) for d in sorted(glob.glob(os.path.join(root, "run_*")))}